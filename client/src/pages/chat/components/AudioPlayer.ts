@@ -1,7 +1,7 @@
 import { SERVER_SAMPLE_RATE, BYTES_PER_SAMPLE } from "../../../types";
 
 export type Base64AudioBuffer = {
-  data: string; // audio data encoded in base64
+  data: string | Uint8Array; // audio data encoded in base64, or raw bytes
   mime_type: string;
 };
 
@@ -73,10 +73,15 @@ export class AudioPlayer {
     audioData: Base64AudioBuffer
   ): Promise<AudioBuffer> {
     // Convert base64 to ArrayBuffer
-    const binaryString = atob(audioData.data);
-    const rawData = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      rawData[i] = binaryString.charCodeAt(i);
+    let rawData: Uint8Array;
+    if (typeof audioData.data === "string") {
+      const binaryString = atob(audioData.data);
+      rawData = new Uint8Array(binaryString.length);
+      for (let i = 0; i < binaryString.length; i++) {
+        rawData[i] = binaryString.charCodeAt(i);
+      }
+    } else {
+      rawData = audioData.data;
     }
 
     // Handle PCM or other formats
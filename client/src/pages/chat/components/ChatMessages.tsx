@@ -323,6 +323,19 @@ const ErrorMessageComponent = ({ msg }: { msg: ErrorViewMessage }) => (
   </div>
 );
 
+function findOpenAudio(
+  viewMessages: ChatViewMessage[],
+  role: MessageRole,
+): AudioViewMessage | undefined {
+  for (let i = viewMessages.length - 1; i >= 0; i--) {
+    const msg = viewMessages[i];
+    if (msg.type === "audio" && msg.role === role && !msg.isComplete) {
+      return msg;
+    }
+  }
+  return undefined;
+}
+
 function processMessages(messages: WebSocketMessage[]): ChatViewMessage[] {
   const viewMessages: ChatViewMessage[] = [];
 
@@ -332,7 +345,23 @@ function processMessages(messages: WebSocketMessage[]): ChatViewMessage[] {
       continue;
     }
     switch (message.type) {
-      case "audio":
+      case "audio": {
+        // Streamed chunks extend the open audio message for the same speaker,
+        // even if other messages (e.g. transcriptions) arrived in between.
+        const open = findOpenAudio(viewMessages, message.role);
+        if (open) {
+          if (message.audio.length > 0) {
+            open.audioBuffers.push({
+              data: message.audio,
+              mime_type: message.mime_type,
+            });
+          }
+          open.isComplete = message.end_of_turn;
+          break;
+        }
+        if (message.audio.length === 0) {
+          break;
+        }
         const audioMsg = {
           type: "audio",
           id: `audio-${viewMessages.length}`,
@@ -348,6 +377,7 @@ function processMessages(messages: WebSocketMessage[]): ChatViewMessage[] {
         } as AudioViewMessage;
         viewMessages.push(audioMsg);
         break;
+      }
 
       case "initialize":
         viewMessages.push({
@@ -1,10 +1,20 @@
-import type { WebSocketMessage } from "../../../types";
+import type { AudioWebSocketMessage, WebSocketMessage } from "../../../types";
+
+// Binary frames carry audio: [u32 header length][JSON header][raw audio]
+const decodeAudioFrame = (frame: ArrayBuffer): AudioWebSocketMessage => {
+  const headerLength = new DataView(frame).getUint32(0);
+  const header = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(frame, 4, headerLength))
+  );
+  return { ...header, audio: new Uint8Array(frame.slice(4 + headerLength)) };
+};
 
 export class TypedWebSocket {
   private ws: WebSocket;
 
   constructor(url: string) {
     this.ws = new WebSocket(url);
+    this.ws.binaryType = "arraybuffer";
   }
 
   public send(message: WebSocketMessage) {
@@ -33,12 +43,22 @@ export class TypedWebSocket {
 
   public set onmessage(handler: (message: WebSocketMessage) => void) {
     this.ws.onmessage = (event) => {
-      const message: WebSocketMessage = JSON.parse(event.data);
-      if (!message.type || !message.role) {
-        console.error("Invalid message format:", message);
+      if (event.data instanceof ArrayBuffer) {
+        handler(decodeAudioFrame(event.data));
         return;
       }
-      handler(message);
+
+      // The server may coalesce several messages into one batch frame
+      const data = JSON.parse(event.data);
+      const messages: WebSocketMessage[] =
+        data.type === "batch" ? data.items : [data];
+      for (const message of messages) {
+        if (!message.type || !message.role) {
+          console.error("Invalid message format:", message);
+          continue;
+        }
+        handler(message);
+      }
     };
   }
 }
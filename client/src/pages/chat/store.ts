@@ -69,7 +69,8 @@ export async function initializeWebSocket(
   };
 
   ws.onmessage = (message: WebSocketMessage) => {
-    if (message.type === "audio") {
+    // Empty audio chunks only mark the end of a streamed turn
+    if (message.type === "audio" && message.audio.length > 0) {
       audioPlayer.addAudioToQueue({
         data: message.audio,
         mime_type: message.mime_type,
@@ -93,7 +93,7 @@ export interface TranscriptionWebSocketMessage extends BaseWebSocketMessage {
 
 export interface AudioWebSocketMessage extends BaseWebSocketMessage {
   type: "audio";
-  audio: string; // Base64 encoded audio data
+  audio: string | Uint8Array; // Base64 encoded, or raw bytes from a binary frame
   mime_type: string;
 }
 
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import enum
 import logging
 import os
@@ -41,6 +42,7 @@ from multivox.tasks import (
     TranscribeAndHintTask,
     UserReaderTask,
     UserWriterTask,
+    get_vad_model,
 )
 from multivox.transcribe import (
     transcribe,
@@ -49,12 +51,14 @@ from multivox.translate import translate
 from multivox.types import (
     LANGUAGES,
     Language,
+    MessageType,
     Scenario,
     TranscribeRequest,
     TranscribeResponse,
     TranslateRequest,
     TranslateResponse,
 )
+from multivox.upstream import close_loop_locals, get_genai_client
 
 BATCH_API_KEY = os.environ.get("GEMINI_API_KEY")
 
@@ -80,7 +84,16 @@ root_logger.addHandler(console_handler)
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI()
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the VAD model at startup instead of on the first audio turn
+    await asyncio.to_thread(get_vad_model)
+    yield
+    # Close the shared upstream clients and their connection pools
+    await close_loop_locals()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(flashcard_router)
 app.include_router(journal_router)
@@ -139,10 +152,13 @@ class ChatContext(pydantic.BaseModel):
     def model_post_init(self, __context) -> None:
         super().model_post_init(__context)
         if self.api_key:
-            self.client = genai.Client(
-                api_key=self.api_key,
-                http_options={"api_version": settings.GEMINI_API_VERSION},
-            )
+            self.client = get_genai_client(self.api_key)
+
+    def _forwarded_types(self) -> set[MessageType]:
+        """Message types the client needs; text-only sessions never play audio"""
+        if self.modality == "text":
+            return set(MessageType) - {MessageType.AUDIO}
+        return set(MessageType)
 
     async def __aenter__(self):
         config = genai_types.LiveConnectConfig()
@@ -181,7 +197,9 @@ class ChatContext(pydantic.BaseModel):
             self.tasks.extend(
                 [
                     UserReaderTask(self.websocket, self.state),
-                    UserWriterTask(self.websocket, self.state),
+                    UserWriterTask(
+                        self.websocket, self.state, types=self._forwarded_types()
+                    ),
                     GeminiReaderTask(self.state, self.gemini_session),
                     GeminiWriterTask(self.state, self.gemini_session),
                     BulkTranscriptionTask(
@@ -197,12 +215,15 @@ class ChatContext(pydantic.BaseModel):
             self.tasks.extend(
                 [
                     UserReaderTask(self.websocket, self.state),
-                    UserWriterTask(self.websocket, self.state),
+                    UserWriterTask(
+                        self.websocket, self.state, types=self._forwarded_types()
+                    ),
                     TranscribeAndHintTask(
                         self.state,
                         native_language=self.native_language,
                         practice_language=self.practice_language,
                         client=self.client,
+                        vad_model=get_vad_model(),
                     ),
                 ]
             )
@@ -230,6 +251,9 @@ class ChatContext(pydantic.BaseModel):
             task.cancel()
         await asyncio.gather(*self.aio_tasks, return_exceptions=True)
 
+        if self.state:
+            await self.state.close()
+
     async def run(self):
         done, pending = await asyncio.wait(
             self.aio_tasks,
@@ -1,9 +1,12 @@
+import asyncio
 import functools
 import hashlib
 import inspect
 import json
 import logging
 import pickle
+import time
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Any, Awaitable, Callable, List, Optional, cast
 
@@ -121,6 +124,109 @@ class FileCache:
 default_file_cache = FileCache(cache_dir=settings.ROOT_DIR / "cache")
 
 
+def _update_digest(digest: Any, value: Any) -> None:
+    """Feed a value into a hash, walking pydantic models field by field."""
+    if isinstance(value, BaseModel):
+        for name, field in value:
+            _update_digest(digest, name)
+            _update_digest(digest, field)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        digest.update(value)
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b"\0")
+
+
+def _digest_key_fn(func: Callable, *args: Any, **kwargs: Any) -> bytes:
+    """Generate a compact cache key from the function and all arguments."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+    for value in args:
+        _update_digest(digest, value)
+    for k, v in sorted(kwargs.items()):
+        _update_digest(digest, k)
+        _update_digest(digest, v)
+    return digest.digest()
+
+
+class MemoryCache:
+    """In-process LRU cache of async call results with a time-to-live.
+
+    Entries hold the call's future rather than its result, so concurrent
+    calls with the same key share a single upstream request. Failed calls
+    are evicted so they can be retried, and a call is cancelled once every
+    caller waiting on it has been cancelled.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, tuple[float, asyncio.Future]] = OrderedDict()
+        # Callers currently awaiting each in-flight call
+        self._waiters: Counter[asyncio.Future] = Counter()
+
+    def _discard_failed(self, key: Any, future: asyncio.Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is future:
+                del self._entries[key]
+
+    async def get_or_call(self, key: Any, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for `key`, calling `fn` on a miss."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            future = entry[1]
+        else:
+            future = asyncio.ensure_future(fn())
+            future.add_done_callback(functools.partial(self._discard_failed, key))
+            self._entries[key] = (now + self.ttl, future)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        if future.done():
+            return future.result()
+        # Shield the shared call so one caller's cancellation doesn't
+        # cancel it for everyone else waiting on it.
+        self._waiters[future] += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+                # Only reachable with the call still running if the last
+                # caller was cancelled: nobody wants the result any more.
+                if not future.done():
+                    future.cancel()
+                    entry = self._entries.get(key)
+                    if entry is not None and entry[1] is future:
+                        del self._entries[key]
+
+    def cache_fn_async[
+        F: Callable[..., Awaitable[Any]]
+    ](self, key_fn: Optional[Callable] = None) -> Callable[[F], F]:
+        """Decorator that caches async function results in memory."""
+        if key_fn is None:
+            key_fn = _digest_key_fn
+
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Any:
+                cache_key = key_fn(func, *args, **kwargs)
+                return await self.get_or_call(
+                    cache_key, functools.partial(func, *args, **kwargs)
+                )
+
+            return cast(F, wrapper)
+
+        return decorator
+
+
+default_memory_cache = MemoryCache()
+
+
 def cached_completion(
     messages: List[dict],
     api_key: Optional[str] = None,
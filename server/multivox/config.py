@@ -40,6 +40,13 @@ class Settings(BaseSettings):
 
     GEMINI_API_VERSION: str = "v1alpha"
 
+    # Concurrent requests to the model / TTS APIs, across all sessions
+    MAX_CONCURRENT_UPSTREAM: int = 8
+
+    # Recent conversation turns included verbatim in prompts; older turns
+    # are folded into a rolling summary.
+    MAX_HISTORY_TURNS: int = 20
+
     def model_post_init(self, __context) -> None:
         super().model_post_init(__context)
 
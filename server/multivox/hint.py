@@ -2,11 +2,15 @@ import logging
 
 from litellm import acompletion
 
+from multivox.cache import default_memory_cache
 from multivox.types import LANGUAGES, HintRequest, HintResponse
+from multivox.upstream import with_backoff
 
 logger = logging.getLogger(__name__)
 
 
+@default_memory_cache.cache_fn_async()
+@with_backoff()
 async def generate_hints(request: HintRequest) -> HintResponse:
     """Generate possible responses to audio input"""
     source_language = LANGUAGES[request.source_language]
@@ -21,7 +25,7 @@ async def generate_hints(request: HintRequest) -> HintResponse:
 
     messages = [
         {"role": "system", "content": language_prompt},
-        {"role": "user", "content": request.hint_prompt + "\n" + request.history}
+        {"role": "user", "content": f"{request.hint_prompt}\n{request.history}"}
     ]
 
     response = await acompletion(
@@ -3,16 +3,25 @@ import logging
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException
-from google import genai
 from google.genai import types as genai_types
 from pydantic import BaseModel, Field
 
 from multivox.config import settings
 from multivox.types import LANGUAGES
+from multivox.upstream import get_genai_client
 
 router = APIRouter(prefix="/api/journal", tags=["journal"])
 logger = logging.getLogger(__name__)
 
+# The request config is the same for every entry
+_JOURNAL_CONFIG = genai_types.GenerateContentConfig(
+    response_mime_type="application/json",
+    automatic_function_calling=genai_types.AutomaticFunctionCallingConfig(
+        disable=True,
+        maximum_remote_calls=0,
+    ),
+)
+
 
 class JournalEntryRequest(BaseModel):
     text: str
@@ -49,10 +58,7 @@ async def analyze_journal_entry(
             status_code=400, detail="API key is required but not provided"
         )
 
-    client = genai.Client(
-        api_key=api_key,
-        http_options={"api_version": settings.GEMINI_API_VERSION},
-    )
+    client = get_genai_client(api_key)
 
     practice_language = LANGUAGES.get(request.practice_language_code)
     if not practice_language:
@@ -108,16 +114,10 @@ async def analyze_journal_entry(
             ],
         )
     ]
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=settings.JOURNAL_MODEL_ID,
         contents=message_parts,
-        config=genai_types.GenerateContentConfig(
-            response_mime_type="application/json",
-            automatic_function_calling=genai_types.AutomaticFunctionCallingConfig(
-                disable=True,
-                maximum_remote_calls=0,
-            ),
-        ),
+        config=_JOURNAL_CONFIG,
     )
 
     if not response.text:
@@ -1,14 +1,92 @@
+import json
 import logging
-from typing import Optional
+import struct
+from typing import Iterable, Iterator, Literal, Optional, Union
 
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from .types import WebSocketMessage, parse_websocket_message_dict
+from .types import (
+    AudioWebSocketMessage,
+    WebSocketMessage,
+    parse_websocket_message_bytes,
+)
 
 logger = logging.getLogger(__name__)
 
+# Binary audio frames are laid out as:
+#   [u32 header length][JSON header (message without `audio`)][raw audio]
+AUDIO_FRAME_HEADER = struct.Struct("!I")
+# Runs of JSON messages are coalesced into text frames of up to this size
+MAX_BATCH_FRAME_BYTES = 64 * 1024
+_BATCH_PREFIX = b'{"type":"batch","items":['
+_BATCH_SUFFIX = b"]}"
+_BATCH_OVERHEAD = len(_BATCH_PREFIX) + len(_BATCH_SUFFIX)
+
+
+def encode_audio_frame(message: AudioWebSocketMessage) -> bytes:
+    """Encode an audio message as a binary frame carrying the raw audio"""
+    header = message.__pydantic_serializer__.to_json(message, exclude={"audio"})
+    return AUDIO_FRAME_HEADER.pack(len(header)) + header + message.audio
+
+
+def decode_audio_frame(frame: bytes) -> AudioWebSocketMessage:
+    """Decode a binary frame produced by `encode_audio_frame`"""
+    (header_len,) = AUDIO_FRAME_HEADER.unpack_from(frame)
+    offset = AUDIO_FRAME_HEADER.size
+    header = json.loads(frame[offset : offset + header_len])
+    message = AudioWebSocketMessage.model_validate({**header, "audio": b""})
+    message.audio = frame[offset + header_len :]
+    return message
+
+
+def encode_batch_frames(
+    messages: Iterable[WebSocketMessage], max_bytes: int = MAX_BATCH_FRAME_BYTES
+) -> Iterator[str]:
+    """Encode (non-audio) messages as JSON text frames of at most `max_bytes` each.
+
+    A frame holding a single message carries it as-is; several are wrapped in
+    a `{"type": "batch", "items": [...]}` envelope. A message larger than
+    `max_bytes` is sent in a frame of its own.
+    """
+    parts: list[bytes] = []
+    size = _BATCH_OVERHEAD
+    for message in messages:
+        part = message.__pydantic_serializer__.to_json(message)
+        if parts and size + len(part) > max_bytes:
+            yield _wrap_batch(parts)
+            parts = []
+            size = _BATCH_OVERHEAD
+        parts.append(part)
+        # Account for the separating comma
+        size += len(part) + 1
+    if parts:
+        yield _wrap_batch(parts)
+
+
+def _wrap_batch(parts: list[bytes]) -> str:
+    if len(parts) == 1:
+        return parts[0].decode()
+    return (_BATCH_PREFIX + b",".join(parts) + _BATCH_SUFFIX).decode()
+
+
+class _BatchFrame(BaseModel):
+    type: Literal["batch"]
+    items: list[WebSocketMessage]
+
+
+_TEXT_FRAME_ADAPTER = TypeAdapter(Union[_BatchFrame, WebSocketMessage])
+
+
+def decode_text_frame(frame: str | bytes) -> list[WebSocketMessage]:
+    """Decode a JSON text frame, unwrapping batch envelopes"""
+    data = _TEXT_FRAME_ADAPTER.validate_json(frame)
+    if isinstance(data, _BatchFrame):
+        return data.items
+    return [data]
+
+
 class TypedWebSocket:
     """Wrapper around WebSocket that only allows sending/receiving WebSocketMessage objects"""
 
@@ -45,14 +123,43 @@ class TypedWebSocket:
 
     async def receive_message(self) -> WebSocketMessage:
         """Receive and validate a WebSocketMessage"""
-        data = await self.websocket.receive_json()
-        logger.debug("C->S: %s", data["type"])
+        # Parse and validate in one pass with pydantic-core rather than
+        # building an intermediate dict with the json module.
+        data = await self.websocket.receive_text()
         try:
-            return parse_websocket_message_dict(data)
+            message = parse_websocket_message_bytes(data)
         except ValidationError as e:
             raise ValueError(f"Invalid WebSocketMessage: {e} -- '{data}'")
+        logger.debug("C->S: %s", message.type)
+        return message
 
     async def send_message(self, message: WebSocketMessage):
         """Send a WebSocketMessage"""
         logger.debug("S->C: %s", message.type)
-        await self.websocket.send_text(message.model_dump_json())
+        # Serialize directly with pydantic-core, skipping model_dump_json's
+        # argument handling. Binary frames are reserved for audio.
+        payload = message.__pydantic_serializer__.to_json(message)
+        await self.websocket.send_text(payload.decode())
+
+    async def send_messages(self, messages: list[WebSocketMessage]):
+        """Send messages in order, coalescing runs of JSON messages into batch frames"""
+        pending: list[WebSocketMessage] = []
+        for message in messages:
+            if isinstance(message, AudioWebSocketMessage):
+                await self._send_batch(pending)
+                pending = []
+                await self.send_audio(message)
+            else:
+                pending.append(message)
+        await self._send_batch(pending)
+
+    async def _send_batch(self, messages: list[WebSocketMessage]):
+        if messages:
+            logger.debug("S->C: %d messages", len(messages))
+        for frame in encode_batch_frames(messages):
+            await self.websocket.send_text(frame)
+
+    async def send_audio(self, message: AudioWebSocketMessage):
+        """Send an audio message as a binary frame, avoiding base64 encoding"""
+        logger.debug("S->C: %s (%d bytes)", message.type, len(message.audio))
+        await self.websocket.send_bytes(encode_audio_frame(message))
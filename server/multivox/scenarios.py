@@ -12,6 +12,7 @@ def load_scenarios() -> List[Scenario]:
 
 
 SCENARIOS = load_scenarios()
+_SCENARIO_INDEX = {s.id: s for s in SCENARIOS}
 
 def list_scenarios() -> Sequence[Scenario]:
     """Return all conversations from all chapters (for backwards compatibility)"""
@@ -20,7 +21,7 @@ def list_scenarios() -> Sequence[Scenario]:
 
 def get_scenario(conversation_id: str) -> Scenario:
     """Get a specific conversation by ID"""
-    for s in SCENARIOS:
-        if s.id == conversation_id:
-            return s
-    raise KeyError(f"Conversation not found: {conversation_id}")
+    try:
+        return _SCENARIO_INDEX[conversation_id]
+    except KeyError:
+        raise KeyError(f"Conversation not found: {conversation_id}") from None
@@ -0,0 +1,27 @@
+import logging
+
+from litellm import acompletion
+
+from multivox.cache import default_memory_cache
+from multivox.config import settings
+from multivox.prompts import HISTORY_SUMMARY_PROMPT
+from multivox.upstream import with_backoff
+
+logger = logging.getLogger(__name__)
+
+
+@default_memory_cache.cache_fn_async()
+@with_backoff()
+async def summarize_history(
+    history: str, model_id: str = settings.COMPLETION_MODEL_ID
+) -> str:
+    """Condense earlier conversation turns into a short summary"""
+    logger.info("Summarizing %d characters of history", len(history))
+    response = await acompletion(
+        model=model_id,
+        messages=[
+            {"role": "system", "content": HISTORY_SUMMARY_PROMPT},
+            {"role": "user", "content": history},
+        ],
+    )
+    return response.choices[0].message.content.strip()  # type: ignore
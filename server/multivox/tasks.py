@@ -1,29 +1,31 @@
 import asyncio
-import base64
-import io
+import functools
+import itertools
 import logging
+import threading
+from typing import Any, Callable, Coroutine, Iterable, Mapping
 
+import numpy as np
 import pydantic
 import torch
-import torchaudio
 from fastapi import WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from google import genai
 from google.genai import live as genai_live
 from google.genai import types as genai_types
 from silero_vad import get_speech_timestamps, load_silero_vad
-from websockets import ConnectionClosedOK
+from websockets import ConnectionClosed, ConnectionClosedOK
 
 from multivox.config import settings
 from multivox.hint import generate_hints
 from multivox.message_socket import TypedWebSocket
+from multivox.summarize import summarize_history
 from multivox.transcribe import (
-    convert_to_wav,
     transcribe,
     transcribe_and_hint,
 )
 from multivox.translate import translate
-from multivox.tts import generate_tts_audio_async
+from multivox.tts import generate_tts_audio_stream
 from multivox.types import (
     CLIENT_SAMPLE_RATE,
     SERVER_SAMPLE_RATE,
@@ -31,6 +33,7 @@ from multivox.types import (
     ErrorWebSocketMessage,
     HintRequest,
     HintWebSocketMessage,
+    InitializeWebSocketMessage,
     Language,
     MessageRole,
     MessageType,
@@ -43,10 +46,31 @@ from multivox.types import (
     WebSocketMessage,
 )
 
-vad_model = load_silero_vad()
-
 logger = logging.getLogger(__name__)
 
+# Bounds on the per-client outgoing queue and on messages sent per batch
+_USER_QUEUE_SIZE = 256
+_USER_BATCH_SIZE = 32
+# Bound on user messages waiting to be forwarded to Gemini
+_GEMINI_QUEUE_SIZE = 256
+# Audio already scanned by VAD which is re-scanned for context (1s of 16-bit PCM)
+_VAD_OVERLAP_BYTES = 2 * CLIENT_SAMPLE_RATE
+# Seconds to wait on subscribers before dispatching continues without them
+_DISPATCH_TIMEOUT = 5.0
+# Seconds over which consecutive Gemini audio chunks are merged into one message
+_GEMINI_AUDIO_WINDOW = 0.025
+
+
+@functools.lru_cache(maxsize=1)
+def get_vad_model() -> torch.nn.Module:
+    """Load the Silero VAD model once per process"""
+    # Keep torch from spinning up a thread pool that competes with the
+    # event loop (and other sessions) for CPU.
+    torch.set_num_threads(1)
+    model = load_silero_vad()
+    model.eval()
+    return model
+
 
 class MessageBuffer:
     """Manages both text and audio content for a speaker"""
@@ -54,19 +78,51 @@ class MessageBuffer:
     def __init__(self, role: MessageRole, sample_rate: int | None = None):
         self.role = role
         self.sample_rate = sample_rate
-        self.current_audio: bytes = b""
+        # Audio is written into a single buffer which is reused across turns:
+        # only the first `_length` bytes belong to the current turn, so
+        # steady-state streaming doesn't reallocate per chunk or per turn.
+        self._audio = bytearray()
+        self._length = 0
         self.turn_complete = False
+        # Incremental VAD state: bytes scanned so far and the sample offset
+        # of the latest detected end of speech.
+        self.vad_cursor = 0
+        self.last_speech_end: int | None = None
+
+    @property
+    def current_length(self) -> int:
+        """Number of audio bytes received this turn"""
+        return self._length
+
+    def current_audio_bytes(self) -> bytes:
+        """Audio received this turn"""
+        return self.audio_from(0)
+
+    def audio_from(self, offset: int) -> bytes:
+        """Audio received this turn starting at byte `offset`"""
+        # Copy out through a memoryview so slicing doesn't make an extra copy.
+        # Callers get bytes rather than a view: a live export would stop the
+        # buffer from growing while e.g. VAD runs on another thread.
+        return bytes(memoryview(self._audio)[max(offset, 0) : self._length])
 
     def add_audio(self, audio: bytes):
-        self.current_audio += audio
+        end = self._length + len(audio)
+        # Overwrites the previous turn's bytes in place, growing only if needed
+        self._audio[self._length : end] = audio
+        self._length = end
 
     def end_turn(self) -> bytes:
-        audio = self.current_audio
-        self.current_audio = b""
+        audio = self.current_audio_bytes()
+        self._length = 0
         self.turn_complete = False
+        self.vad_cursor = 0
+        self.last_speech_end = None
         return audio
 
 
+MessageHandler = Callable[[WebSocketMessage], Coroutine[Any, Any, None]]
+
+
 class MessageSubscriber:
     """Base class for message subscribers"""
 
@@ -74,6 +130,11 @@ class MessageSubscriber:
         raise NotImplementedError()
 
 
+def _empty_routes() -> dict[tuple[MessageRole, MessageType], list[MessageHandler]]:
+    """A routing table with no handlers for any (role, type) pair"""
+    return {key: [] for key in itertools.product(MessageRole, MessageType)}
+
+
 class ChatState(pydantic.BaseModel):
     """Holds the conversation state and manages message distribution."""
 
@@ -84,32 +145,173 @@ class ChatState(pydantic.BaseModel):
     modality: str
     user_ws: TypedWebSocket
     session: genai_live.AsyncSession | None
-    history: list[WebSocketMessage] = pydantic.Field(default_factory=list)
     subscribers: list[MessageSubscriber] = pydantic.Field(default_factory=list)
 
-    def add_subscriber(self, subscriber: MessageSubscriber) -> None:
-        """Add a new message subscriber"""
+    # Scenario and conversation transcript lines used to prompt models,
+    # maintained incrementally as messages are recorded
+    _scenario: str = pydantic.PrivateAttr(default="")
+    _history_prompt_lines: list[str] = pydantic.PrivateAttr(default_factory=list)
+    # Background summarization of the oldest prompt lines, if one is running
+    _compaction: asyncio.Task | None = pydantic.PrivateAttr(default=None)
+
+    # Handlers bucketed by the (role, type) pairs they registered interest in
+    _routes: dict[tuple[MessageRole, MessageType], list[MessageHandler]] = (
+        pydantic.PrivateAttr(default_factory=_empty_routes)
+    )
+
+    def add_subscriber(
+        self,
+        subscriber: MessageSubscriber,
+        roles: Iterable[MessageRole] | None = None,
+        types: Iterable[MessageType] | None = None,
+        handlers: Mapping[MessageType, MessageHandler] | None = None,
+    ) -> None:
+        """Add a new message subscriber.
+
+        `roles` and `types` restrict which messages are delivered to the
+        subscriber's `handle_message`; `None` means all roles or all types.
+        Alternatively `handlers` maps each message type of interest to the
+        method handling it, which is then called directly.
+        """
         self.subscribers.append(subscriber)
+        if handlers is None:
+            types = MessageType if types is None else frozenset(types)
+            handlers = dict.fromkeys(types, subscriber.handle_message)
+        for role in MessageRole if roles is None else frozenset(roles):
+            for message_type, handler in handlers.items():
+                self._routes[(role, message_type)].append(handler)
+
+    def record(self, message: WebSocketMessage) -> None:
+        """Add a message to the conversation history used in prompts"""
+        if message.type == MessageType.INITIALIZE:
+            self._scenario = message.text
+        elif message.type == MessageType.TRANSCRIPTION:
+            self._history_prompt_lines.append(
+                f"> {message.role.value}: {message.source_text}"
+            )
+        elif message.type == MessageType.TEXT:
+            self._history_prompt_lines.append(f"> {message.role.value}: {message.text}")
+        else:
+            return
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Fold the oldest turns into a summary once the transcript is too long.
+
+        Compaction starts at twice the window, so it runs once per
+        MAX_HISTORY_TURNS turns rather than on every turn.
+        """
+        lines = self._history_prompt_lines
+        window = settings.MAX_HISTORY_TURNS
+        if len(lines) <= 2 * window or self._compaction is not None:
+            return
+        self._compaction = asyncio.create_task(self._compact(len(lines) - window))
+
+    async def _compact(self, count: int) -> None:
+        # Lines are only ever appended while this runs, so the oldest `count`
+        # lines are still the ones being summarized when it completes. A
+        # previous summary is among them and gets folded into the new one.
+        try:
+            summary = await summarize_history(
+                "\n".join(self._history_prompt_lines[:count])
+            )
+            self._history_prompt_lines[:count] = [f"> summary: {summary}"]
+        except Exception:
+            logger.exception("Failed to summarize history, truncating instead")
+            del self._history_prompt_lines[:count]
+        finally:
+            self._compaction = None
+
+    async def close(self) -> None:
+        """Cancel background work started on behalf of the conversation"""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.cancel()
+            await asyncio.gather(compaction, return_exceptions=True)
+
+    def history_prompt(self) -> tuple[str, str]:
+        """Return the scenario and the conversation history formatted for prompts"""
+        return self._scenario, "\n".join(self._history_prompt_lines)
 
     async def handle_message(self, message: WebSocketMessage) -> None:
-        """Distribute message to all subscribers"""
+        """Record a message and distribute it to all interested subscribers"""
+        self.record(message)
+        await self.dispatch(message)
+
+    async def dispatch(self, message: WebSocketMessage) -> None:
+        """Distribute an already recorded message to interested subscribers"""
         logger.debug(
             "Handling message: %s, %s, end: %s",
             message.type,
             message.role,
             message.end_of_turn,
         )
-        self.history.append(message)
 
-        # Distribute to all subscribers
-        for subscriber in self.subscribers:
+        # Distribute to the handlers interested in this message
+        handlers = self._routes.get((message.role, message.type), ())
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            handler = handlers[0]
             try:
-                await subscriber.handle_message(message)
-            except Exception:
-                logger.exception(
-                    f"Error in subscriber {subscriber.__class__.__name__}",
-                    stack_info=True,
+                # asyncio.timeout doesn't wrap the call in a task the way
+                # wait_for does, keeping the common single-subscriber path cheap.
+                async with asyncio.timeout(_DISPATCH_TIMEOUT):
+                    await handler(message)
+            except TimeoutError:
+                logger.warning(
+                    "Handler %s timed out on %s", handler.__qualname__, message.type
                 )
+            except Exception:
+                _log_handler_error(handler)
+            return
+
+        # Notify subscribers concurrently so a slow one doesn't hold up the
+        # rest. Tasks start eagerly: most handlers just enqueue the message
+        # and finish without suspending, so they never go through the loop.
+        loop = asyncio.get_running_loop()
+        tasks = {
+            asyncio.Task(
+                _call_handler(handler, message), loop=loop, eager_start=True
+            ): handler
+            for handler in handlers
+        }
+        pending = [task for task in tasks if not task.done()]
+        if not pending:
+            return
+        try:
+            async with asyncio.timeout(_DISPATCH_TIMEOUT):
+                await asyncio.wait(pending)
+        except TimeoutError:
+            for task in pending:
+                if not task.done():
+                    logger.warning(
+                        "Handler %s timed out on %s",
+                        tasks[task].__qualname__,
+                        message.type,
+                    )
+        finally:
+            # Handlers still running on timeout, or when dispatch itself is
+            # cancelled, are cancelled rather than left running unowned.
+            for task in pending:
+                task.cancel()
+
+
+async def _call_handler(handler: MessageHandler, message: WebSocketMessage) -> None:
+    # Errors are logged here rather than surfacing through dispatch, so one
+    # failing handler doesn't affect the others.
+    try:
+        await handler(message)
+    except Exception:
+        _log_handler_error(handler)
+
+
+def _log_handler_error(handler: MessageHandler) -> None:
+    logger.error(
+        f"Error in subscriber {handler.__qualname__}",
+        exc_info=True,
+        stack_info=True,
+    )
 
 
 class LongRunningTask:
@@ -144,10 +346,49 @@ class BulkTranscriptionTask(LongRunningTask, MessageSubscriber):
         self.native_language = native_language
         self.client = client
         self.buffer = MessageBuffer(MessageRole.ASSISTANT, SERVER_SAMPLE_RATE)
-        state.add_subscriber(self)
+        # Completed turns, processed in order by a single worker task
+        self._turns: asyncio.Queue[tuple[bytes | None, str | None, MessageRole]] = (
+            asyncio.Queue()
+        )
+        self._handlers: dict[MessageType, MessageHandler] = {
+            MessageType.AUDIO: self._on_audio,
+            MessageType.TEXT: self._on_text,
+        }
+        state.add_subscriber(
+            self, roles={MessageRole.ASSISTANT}, handlers=self._handlers
+        )
 
     async def start(self):
-        return []  # No background tasks needed
+        return [asyncio.create_task(self._process_turns())]
+
+    async def _process_turns(self):
+        while self.running():
+            audio, text, role = await self._turns.get()
+            await self._process_turn(audio, text, role)
+
+    def _start_turn(
+        self, audio: bytes | None, text: str | None, role: MessageRole
+    ) -> None:
+        """Queue a turn for the worker so the dispatcher isn't blocked"""
+        self._turns.put_nowait((audio, text, role))
+
+    async def _send_hints(self) -> None:
+        """Generate hints for the conversation so far and publish them"""
+        scenario, history_prompt = self.state.history_prompt()
+        hints = await generate_hints(
+            HintRequest(
+                history=history_prompt,
+                scenario=scenario,
+                source_language=self.practice_language.abbreviation,
+                target_language=self.native_language.abbreviation,
+            )
+        )
+        hint_msg = HintWebSocketMessage(
+            role=MessageRole.ASSISTANT,
+            hints=hints.hints,
+            end_of_turn=True,
+        )
+        await self.state.handle_message(hint_msg)
 
     async def _process_turn(
         self, audio: bytes | None, text: str | None, role: MessageRole
@@ -190,37 +431,16 @@ class BulkTranscriptionTask(LongRunningTask, MessageSubscriber):
             else:
                 return
 
-            await self.state.handle_message(msg)
-
-            # Generate hints for assistant messages
             if role == MessageRole.ASSISTANT:
-                history_items = []
-                scenario = ""
-                for hist_msg in self.state.history:
-                    if hist_msg.type == MessageType.INITIALIZE:
-                        scenario = hist_msg.text
-                    if hist_msg.type == MessageType.TRANSCRIPTION:
-                        history_items.append(
-                            f"> {hist_msg.role}: {hist_msg.source_text}"
-                        )
-                    elif hist_msg.type == MessageType.TEXT:
-                        history_items.append(f"> {hist_msg.role}: {hist_msg.text}")
-
-                history_prompt = "\n".join(history_items)
-                hints = await generate_hints(
-                    HintRequest(
-                        history=history_prompt,
-                        scenario=scenario,
-                        source_language=self.practice_language.abbreviation,
-                        target_language=self.native_language.abbreviation,
-                    )
+                # Generate hints while the transcription is delivered.
+                # `handle_message` records `msg` in the history before its
+                # first await, and gather starts its tasks in order, so the
+                # hint prompt includes this turn.
+                await asyncio.gather(
+                    self.state.handle_message(msg), self._send_hints()
                 )
-                hint_msg = HintWebSocketMessage(
-                    role=MessageRole.ASSISTANT,
-                    hints=hints.hints,
-                    end_of_turn=True,
-                )
-                await self.state.handle_message(hint_msg)
+            else:
+                await self.state.handle_message(msg)
 
         except Exception as e:
             logger.exception("Error processing turn")
@@ -231,25 +451,25 @@ class BulkTranscriptionTask(LongRunningTask, MessageSubscriber):
             await self.state.handle_message(error_msg)
 
     async def handle_message(self, message: WebSocketMessage) -> None:
-        """Handle incoming messages"""
-        # Skip messages we don't need to process
-        if message.type in (MessageType.TRANSCRIPTION, MessageType.HINT):
-            return
-        if message.role != MessageRole.ASSISTANT:
-            return
+        """Handle a message through the same table ChatState routes with"""
+        handler = self._handlers.get(message.type)
+        if handler is not None:
+            await handler(message)
+
+    async def _on_audio(self, message: WebSocketMessage) -> None:
+        assert isinstance(message, AudioWebSocketMessage)
+        self.buffer.add_audio(message.audio)
+        if message.end_of_turn:
+            audio = self.buffer.end_turn()
+            if audio:
+                logger.info("Processing audio turn: %d bytes", len(audio))
+                self._start_turn(audio, None, message.role)
 
-        # Handle audio messages
-        if message.type == MessageType.AUDIO:
-            self.buffer.add_audio(message.audio)
-            if message.end_of_turn:
-                audio = self.buffer.end_turn()
-                if audio:
-                    logger.info("Processing audio turn: %d bytes", len(audio))
-                    await self._process_turn(audio, None, message.role)
-        # Handle text messages
-        elif message.type == MessageType.TEXT and message.end_of_turn:
+    async def _on_text(self, message: WebSocketMessage) -> None:
+        assert isinstance(message, TextWebSocketMessage)
+        if message.end_of_turn:
             logger.info("Processing text turn: %s", message.text)
-            await self._process_turn(None, message.text, message.role)
+            self._start_turn(None, message.text, message.role)
 
 
 class GeminiReaderTask(LongRunningTask, MessageSubscriber):
@@ -262,44 +482,90 @@ class GeminiReaderTask(LongRunningTask, MessageSubscriber):
     ):
         LongRunningTask.__init__(self, state)
         self.session = session
-        state.add_subscriber(self)
+        # Responses from Gemini, or None once the session ends. Buffering
+        # them lets `_process` wait with a timeout without cancelling the
+        # session's receive generator.
+        self._responses: asyncio.Queue[genai_types.LiveServerMessage | None] = (
+            asyncio.Queue()
+        )
+        # Reader only: it publishes messages but never consumes them
+        state.add_subscriber(self, types=())
 
     async def start(self):
-        return [asyncio.create_task(self._process())]
+        return [
+            asyncio.create_task(self._receive()),
+            asyncio.create_task(self._process()),
+        ]
 
-    async def _process(self):
+    async def _receive(self):
         while self.running():
             try:
                 async for response in self.session.receive():
-                    end_of_turn = bool(
-                        response.server_content
-                        and response.server_content.turn_complete
-                    )
-                    if response.data:
-                        logger.debug(
-                            "Received %d bytes of audio from Gemini", len(response.data)
-                        )
-                        message = AudioWebSocketMessage(
-                            audio=base64.b64encode(response.data),
-                            role=MessageRole.ASSISTANT,
-                            end_of_turn=end_of_turn,
-                            mime_type=f"audio/pcm;rate={settings.SERVER_SAMPLE_RATE}",
-                        )
-                        await self.state.handle_message(message)
-                    else:
-                        logger.debug("Received text from Gemini: %s", response.text)
-                        message = TextWebSocketMessage(
-                            text=response.text or "",
-                            role=MessageRole.ASSISTANT,
-                            end_of_turn=end_of_turn,
-                        )
-                        await self.state.handle_message(message)
+                    self._responses.put_nowait(response)
             except ConnectionClosedOK:
                 pass
             except Exception as e:
-                logger.error(f"Error processing Gemini response: {e}", exc_info=True)
+                logger.error(f"Error receiving Gemini response: {e}", exc_info=True)
+                break
+        self._responses.put_nowait(None)
+
+    async def _publish_audio(self, pending: bytearray, end_of_turn: bool):
+        """Publish and clear the audio accumulated so far"""
+        logger.debug("Received %d bytes of audio from Gemini", len(pending))
+        message = AudioWebSocketMessage.from_raw(
+            audio=bytes(pending),
+            role=MessageRole.ASSISTANT,
+            end_of_turn=end_of_turn,
+            mime_type=f"audio/pcm;rate={settings.SERVER_SAMPLE_RATE}",
+        )
+        pending.clear()
+        await self.state.handle_message(message)
+
+    async def _process(self):
+        # Gemini streams audio in many small chunks; merge those arriving
+        # within a short window so each message isn't fanned out separately.
+        pending = bytearray()
+        deadline: float | None = None
+        while True:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    response = await self._responses.get()
+            except TimeoutError:
+                await self._publish_audio(pending, end_of_turn=False)
+                deadline = None
+                continue
+            if response is None:
+                # The session ended: don't lose the tail of the last utterance
+                if pending:
+                    await self._publish_audio(pending, end_of_turn=True)
                 break
 
+            # `data` is a property which joins the message parts on each
+            # access, so read it once.
+            content = response.server_content
+            end_of_turn = content is not None and content.turn_complete is True
+            data = response.data
+            if data is not None:
+                pending += data
+                if end_of_turn:
+                    await self._publish_audio(pending, end_of_turn=True)
+                    deadline = None
+                elif deadline is None:
+                    loop = asyncio.get_running_loop()
+                    deadline = loop.time() + _GEMINI_AUDIO_WINDOW
+                continue
+
+            if pending:
+                await self._publish_audio(pending, end_of_turn=False)
+                deadline = None
+            logger.debug("Received text from Gemini: %s", response.text)
+            message = TextWebSocketMessage(
+                text=response.text or "",
+                role=MessageRole.ASSISTANT,
+                end_of_turn=end_of_turn,
+            )
+            await self.state.handle_message(message)
+
     async def handle_message(self, message: WebSocketMessage) -> None:
         """Handle messages from other components (no-op for reader)"""
         pass
@@ -315,31 +581,70 @@ class GeminiWriterTask(LongRunningTask, MessageSubscriber):
     ):
         LongRunningTask.__init__(self, state)
         self.session = session
-        state.add_subscriber(self)
+        # Outgoing messages, sent in order by a single writer task so a slow
+        # Gemini connection doesn't hold up the dispatcher
+        self._queue: asyncio.Queue[WebSocketMessage] = asyncio.Queue(
+            maxsize=_GEMINI_QUEUE_SIZE
+        )
+        self._senders: dict[MessageType, MessageHandler] = {
+            MessageType.INITIALIZE: self._send_initialize,
+            MessageType.AUDIO: self._send_audio,
+            MessageType.TEXT: self._send_text,
+        }
+        state.add_subscriber(
+            self, roles={MessageRole.USER}, types=self._senders.keys()
+        )
 
     async def start(self):
-        return []  # No background tasks needed
+        return [asyncio.create_task(self._process())]
+
+    async def _process(self):
+        while self.running():
+            message = await self._queue.get()
+            try:
+                await self._senders[message.type](message)
+            except asyncio.CancelledError:
+                break
+            except ConnectionClosed:
+                logger.info("Gemini connection closed")
+                break
+            except Exception as e:
+                logger.error(f"Error sending to Gemini: {e}", exc_info=True)
 
     async def handle_message(self, message: WebSocketMessage) -> None:
-        """Forward appropriate messages to Gemini"""
-        if message.role != MessageRole.USER:
+        """Queue appropriate messages to forward to Gemini"""
+        if message.role != MessageRole.USER or message.type not in self._senders:
             return
-
-        if message.type == MessageType.INITIALIZE:
-            await self.session.send(input=message.text, end_of_turn=True)
-        elif isinstance(message, AudioWebSocketMessage):
-            await self.session.send(
-                input=genai_types.LiveClientRealtimeInput(
-                    media_chunks=[
-                        genai_types.Blob(
-                            data=message.audio,
-                            mime_type=message.mime_type,
-                        )
-                    ]
-                )
+        if message.type != MessageType.AUDIO:
+            # Initialize and text turns are part of the conversation and must
+            # not be lost; the dispatch timeout bounds the wait for space.
+            await self._queue.put(message)
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Dropping audio for slow Gemini session")
+
+    async def _send_initialize(self, message: WebSocketMessage) -> None:
+        assert isinstance(message, InitializeWebSocketMessage)
+        await self.session.send(input=message.text, end_of_turn=True)
+
+    async def _send_audio(self, message: WebSocketMessage) -> None:
+        assert isinstance(message, AudioWebSocketMessage)
+        await self.session.send(
+            input=genai_types.LiveClientRealtimeInput(
+                media_chunks=[
+                    genai_types.Blob(
+                        data=message.audio,
+                        mime_type=message.mime_type,
+                    )
+                ]
             )
-        elif isinstance(message, TextWebSocketMessage):
-            await self.session.send(input=message.text or " ", end_of_turn=True)
+        )
+
+    async def _send_text(self, message: WebSocketMessage) -> None:
+        assert isinstance(message, TextWebSocketMessage)
+        await self.session.send(input=message.text or " ", end_of_turn=True)
 
 
 class UserReaderTask(LongRunningTask, MessageSubscriber):
@@ -352,7 +657,8 @@ class UserReaderTask(LongRunningTask, MessageSubscriber):
     ):
         LongRunningTask.__init__(self, state)
         self.websocket = websocket
-        state.add_subscriber(self)
+        # Reader only: it publishes messages but never consumes them
+        state.add_subscriber(self, types=())
 
     async def start(self) -> list[asyncio.Task]:
         return [asyncio.create_task(self._process())]
@@ -385,40 +691,87 @@ class UserWriterTask(LongRunningTask, MessageSubscriber):
         self,
         websocket: TypedWebSocket,
         state: ChatState,
+        types: Iterable[MessageType] | None = None,
     ):
+        """`types` limits the messages forwarded to the client, e.g. to skip
+        audio for text-only sessions. Initialize messages are never sent back."""
         LongRunningTask.__init__(self, state)
         self.websocket = websocket
-        state.add_subscriber(self)
+        # Outgoing messages, drained in batches by a single writer task
+        self._queue: asyncio.Queue[WebSocketMessage] = asyncio.Queue(
+            maxsize=_USER_QUEUE_SIZE
+        )
+        types = MessageType if types is None else types
+        state.add_subscriber(
+            self,
+            roles={MessageRole.ASSISTANT, MessageRole.SYSTEM},
+            types=set(types) - {MessageType.INITIALIZE},
+        )
 
     async def start(self):
-        return []  # No background tasks needed
+        return [asyncio.create_task(self._process())]
+
+    async def _process(self):
+        while self.running():
+            batch = [await self._queue.get()]
+            while len(batch) < _USER_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self.websocket.send_messages(batch)
+            except asyncio.CancelledError:
+                break
+            except WebSocketDisconnect:
+                logger.info("Client disconnected")
+                break
+            except Exception as e:
+                logger.error(f"Error sending to client: {e}", exc_info=True)
+                break
 
     async def handle_message(self, message: WebSocketMessage) -> None:
-        """Forward appropriate messages to user"""
-        if message.role == MessageRole.USER:
-            return
-        if message.type == MessageType.INITIALIZE:
-            # don't forward the initialize message back
+        """Queue a message for the user.
+
+        Only assistant and system messages are routed here, and never the
+        initialize message, which isn't forwarded back.
+        """
+        if message.type != MessageType.AUDIO:
+            # Transcripts, hints, errors and status updates must all arrive;
+            # the dispatch timeout bounds how long this can wait for space.
+            await self._queue.put(message)
             return
-
-        await self.websocket.send_message(message)
-
-
-def wav_to_tensor(
-    wav_file: genai_types.Blob, sampling_rate: int = 16000
-) -> torch.Tensor:
-    """Convert a WAV file to a PyTorch tensor"""
-    assert wav_file.data
-    wav, sr = torchaudio.load(io.BytesIO(wav_file.data), format="wav")
-
-    if wav.size(0) > 1:
-        wav = wav.mean(dim=0, keepdim=True)
-
-    if sr != sampling_rate:
-        transform = torchaudio.transforms.Resample(orig_freq=sr, new_freq=sampling_rate)
-        wav = transform(wav)
-
-    return wav.squeeze(0)
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # The client isn't keeping up; drop audio rather than buffer it
+            # without bound
+            logger.warning("Dropping audio for slow client")
+
+
+def pcm_to_tensor(pcm: bytes) -> torch.Tensor:
+    """Convert mono 16-bit little-endian PCM to a float tensor in [-1, 1)"""
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+    samples *= 1 / 32768
+    return torch.from_numpy(samples)
+
+
+# The Silero model keeps internal state between calls, so scans using the
+# shared model must not overlap. The lock is taken on the worker thread: an
+# asyncio lock would be released when the awaiting handler is cancelled (e.g.
+# by the dispatch timeout) while the thread was still running the model.
+_VAD_LOCK = threading.Lock()
+
+
+def _vad_scan(vad_model: torch.nn.Module, pcm: bytes) -> list[dict]:
+    """Return speech timestamps (in samples) for a chunk of client PCM audio"""
+    # Silero consumes samples directly, so decode the PCM rather than
+    # wrapping it in a WAV container only to parse it back out.
+    buffer_tensor = pcm_to_tensor(pcm)
+    with _VAD_LOCK, torch.inference_mode():
+        return get_speech_timestamps(
+            buffer_tensor,
+            vad_model,
+            sampling_rate=settings.CLIENT_SAMPLE_RATE,
+            return_seconds=False,
+        )
 
 
 class TranscribeAndHintTask(LongRunningTask, MessageSubscriber):
@@ -430,59 +783,72 @@ class TranscribeAndHintTask(LongRunningTask, MessageSubscriber):
         practice_language: Language,
         native_language: Language,
         client: genai.Client,
+        vad_model: torch.nn.Module,
     ):
         LongRunningTask.__init__(self, state)
         self.practice_language = practice_language
         self.native_language = native_language
         self.client = client
+        self.vad_model = vad_model
         self.buffer = MessageBuffer(MessageRole.USER, CLIENT_SAMPLE_RATE)
-        state.add_subscriber(self)
+        # Completed turns, processed in order by a single worker task
+        self._turns: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._handlers: dict[MessageType, MessageHandler] = {
+            MessageType.INITIALIZE: self._on_initialize,
+            MessageType.AUDIO: self._on_audio,
+            MessageType.TEXT: self._check_end_of_turn,
+        }
+        state.add_subscriber(
+            self,
+            roles={MessageRole.USER, MessageRole.SYSTEM},
+            handlers=self._handlers,
+        )
 
     async def start(self):
-        return []  # No background tasks needed
-
-    async def _get_history(self) -> tuple[str, str]:
-        """Extract scenario and conversation history"""
-        history_items = []
-        scenario = ""
-        for msg in self.state.history:
-            if msg.type == MessageType.INITIALIZE:
-                scenario = msg.text
-            if msg.type == MessageType.TRANSCRIPTION:
-                history_items.append(f"> {msg.role.value}: {msg.source_text}")
-            elif msg.type == MessageType.TEXT:
-                history_items.append(f"> {msg.role.value}: {msg.text}")
-        return scenario, "\n".join(history_items)
+        return [asyncio.create_task(self._process_turns())]
+
+    async def _process_turns(self):
+        while self.running():
+            audio = await self._turns.get()
+            await self._process_turn(audio)
 
     async def _generate_and_send_tts(self, text: str) -> None:
-        """Generate TTS audio and send it as a message"""
+        """Generate TTS audio and stream it to the client as it is synthesized"""
         try:
-            audio_response = await generate_tts_audio_async(
-                text, self.practice_language
-            )
-            if audio_response:
-                audio_msg = AudioWebSocketMessage(
-                    audio=base64.b64encode(audio_response.data),
+            async for chunk in generate_tts_audio_stream(text, self.practice_language):
+                await self.state.handle_message(
+                    AudioWebSocketMessage.from_raw(
+                        audio=chunk,
+                        role=MessageRole.ASSISTANT,
+                        end_of_turn=False,
+                        mime_type="audio/mp3",
+                    )
+                )
+        except Exception:
+            logger.exception("Error generating audio")
+        finally:
+            # Close out the audio turn with an empty chunk
+            await self.state.handle_message(
+                AudioWebSocketMessage.from_raw(
+                    audio=b"",
                     role=MessageRole.ASSISTANT,
                     end_of_turn=True,
                     mime_type="audio/mp3",
                 )
-                await self.state.handle_message(audio_msg)
-        except Exception:
-            logger.exception("Error generating audio")
+            )
 
     async def _process_turn(self, audio: bytes | None):
         """Process a complete turn from the user"""
         logger.info("Turn.")
         await self.state.handle_message(ProcessingWebSocketMessage(status="started"))
         try:
-            scenario, history = await self._get_history()
+            scenario, history = self.state.history_prompt()
 
             response = await transcribe_and_hint(
                 TranscribeAndHintRequest(
                     scenario=scenario,
                     history=history,
-                    audio=base64.b64encode(audio) if audio else None,
+                    audio=audio,
                     mime_type=(
                         f"audio/pcm;rate={settings.CLIENT_SAMPLE_RATE}"
                         if audio
@@ -493,13 +859,6 @@ class TranscribeAndHintTask(LongRunningTask, MessageSubscriber):
                 )
             )
 
-            # Start TTS generation in background
-            tts_task = None
-            if self.state.modality == "audio":
-                tts_task = asyncio.create_task(
-                    self._generate_and_send_tts(response.response_text)
-                )
-
             # if we had an audio sample, send it to the user
             # and add it to our history
             user_msg = TranscriptionWebSocketMessage(
@@ -510,10 +869,6 @@ class TranscribeAndHintTask(LongRunningTask, MessageSubscriber):
                 translated_text="",
                 end_of_turn=True,
             )
-            logger.info("Sending %s", user_msg)
-            await self.state.handle_message(user_msg)
-
-            # Send transcription while TTS generates
             transcription = TranscriptionWebSocketMessage(
                 role=MessageRole.ASSISTANT,
                 source_text=response.response_text,
@@ -522,17 +877,29 @@ class TranscribeAndHintTask(LongRunningTask, MessageSubscriber):
                 translated_text=response.translated_text,
                 end_of_turn=True,
             )
-            await self.state.handle_message(transcription)
-
             hint = HintWebSocketMessage(
                 role=MessageRole.ASSISTANT,
                 hints=response.hints,
                 end_of_turn=True,
             )
-            await self.state.handle_message(hint)
+            turn = (user_msg, transcription, hint)
+
+            # Record the whole turn up front so the history is complete while
+            # the messages are delivered concurrently with TTS generation.
+            for msg in turn:
+                self.state.record(msg)
 
-            if tts_task:
-                await tts_task
+            async def send_turn() -> None:
+                logger.info("Sending %s", user_msg)
+                for msg in turn:
+                    await self.state.dispatch(msg)
+
+            # TTS goes first so its request is in flight before we send
+            pending = []
+            if self.state.modality == "audio":
+                pending.append(self._generate_and_send_tts(response.response_text))
+            pending.append(send_turn())
+            await asyncio.gather(*pending)
 
         except Exception as e:
             logger.exception("Error processing turn")
@@ -540,69 +907,73 @@ class TranscribeAndHintTask(LongRunningTask, MessageSubscriber):
                 ProcessingWebSocketMessage(status="completed")
             )
 
-            msg = ErrorWebSocketMessage(
+            error_msg = ErrorWebSocketMessage(
                 text=f"Sorry, I ran into an error when responding: {e}",
                 role=MessageRole.ASSISTANT,
             )
-            await self.state.handle_message(msg)
+            await self.state.handle_message(error_msg)
         finally:
             await self.state.handle_message(
                 ProcessingWebSocketMessage(status="completed")
             )
 
+    async def _scan_for_speech(self) -> None:
+        """Run VAD over audio received since the last scan.
+
+        Only the new tail of the buffer (plus some already scanned audio for
+        context) is scanned, and the latest end of speech is tracked on the
+        buffer, instead of re-scanning the whole turn for every chunk. The
+        scan runs in a worker thread so it doesn't block the event loop.
+        """
+        start = max(0, self.buffer.vad_cursor - _VAD_OVERLAP_BYTES)
+        window = self.buffer.audio_from(start)
+        timestamps = await asyncio.to_thread(_vad_scan, self.vad_model, window)
+        self.buffer.vad_cursor = start + len(window)
+
+        # timestamps are in samples relative to the start of the window
+        offset = start // 2
+        end_ts = [offset + ts["end"] for ts in timestamps if ts["end"]]
+        if end_ts:
+            last_end = self.buffer.last_speech_end
+            self.buffer.last_speech_end = max(end_ts[-1], last_end or 0)
+
     async def handle_message(self, message: WebSocketMessage) -> None:
-        """Handle incoming messages"""
-        # Skip messages we don't need to process
-        if message.type not in (
-            MessageType.TEXT,
-            MessageType.AUDIO,
-            MessageType.INITIALIZE,
-        ):
-            return
-        if message.role == MessageRole.ASSISTANT:
-            return
+        """Handle a message through the same table ChatState routes with"""
+        handler = self._handlers.get(message.type)
+        if handler is not None:
+            await handler(message)
 
-        # Handle initialization separately
-        if message.type == MessageType.INITIALIZE:
-            await self._process_turn(None)
-            return
+    async def _on_initialize(self, message: WebSocketMessage) -> None:
+        self._turns.put_nowait(None)
 
-        if message.type == MessageType.AUDIO:
-            self.buffer.add_audio(message.audio)
+    async def _on_audio(self, message: WebSocketMessage) -> None:
+        assert isinstance(message, AudioWebSocketMessage)
+        self.buffer.add_audio(message.audio)
+        await self._check_end_of_turn(message)
 
+    async def _check_end_of_turn(self, message: WebSocketMessage) -> None:
         # Check if we have a complete turn
         end_of_turn = message.end_of_turn
 
         # For audio, use VAD to detect speech boundaries
         # We need about a second of buffer at the end to reliably handle
         # the end of speech. We assume we have 1 channel at 16 bit PCM.
+        # Turns the client already ended skip VAD, so a slow or cancelled
+        # scan can't lose them.
         SPEECH_BUFFER = 1.0 * 2 * CLIENT_SAMPLE_RATE
-        if len(self.buffer.current_audio) > SPEECH_BUFFER:
-            buffer_wav = convert_to_wav(
-                genai_types.Blob(
-                    data=self.buffer.current_audio,
-                    mime_type=f"audio/pcm;rate={settings.CLIENT_SAMPLE_RATE}",
-                )
-            )
-            buffer_tensor = wav_to_tensor(
-                buffer_wav, sampling_rate=settings.CLIENT_SAMPLE_RATE
-            )
-            timestamps = get_speech_timestamps(
-                buffer_tensor, vad_model, return_seconds=False
-            )
-            end_ts = [ts["end"] for ts in timestamps if ts["end"]]
+        if not end_of_turn and self.buffer.current_length > SPEECH_BUFFER:
+            await self._scan_for_speech()
 
             # we want to ignore the end if it's at the end of our buffer
             # this is currently a hack - we divide the buffer length by
             # 2 to get the sample count and compare
-            if end_ts:
-                last_ts = end_ts[-1]
-                buffer_ts = len(self.buffer.current_audio) // 2
+            last_ts = self.buffer.last_speech_end
+            if last_ts is not None:
+                buffer_ts = self.buffer.current_length // 2
                 if last_ts < buffer_ts - SPEECH_BUFFER:
                     logger.info("Hit - TS: %s, buffer %s", last_ts, buffer_ts)
                     end_of_turn = True
 
         # Process the turn if complete
         if end_of_turn:
-            audio = self.buffer.end_turn()
-            await self._process_turn(audio)
+            self._turns.put_nowait(self.buffer.end_turn())
@@ -1,13 +1,14 @@
 import datetime
+import functools
 import io
 import logging
-import wave
+import struct
 from typing import List
 
-from google import genai
 from google.genai import types as genai_types
 from litellm import atranscription
 
+from multivox.cache import default_memory_cache
 from multivox.config import settings
 from multivox.prompts import (
     TRANSCRIBE_AND_HINT_PROMPT,
@@ -21,10 +22,13 @@ from multivox.types import (
     TranscribeResponse,
     TranslateRequest,
 )
+from multivox.upstream import call_with_backoff, get_genai_client, with_backoff
 
 logger = logging.getLogger(__name__)
 
 
+# Only a handful of distinct mime types are ever seen
+@functools.lru_cache(maxsize=8)
 def extract_sample_rate(mime_type: str) -> int:
     """Extract sample rate from mime type string like 'audio/pcm;rate=16000'"""
     if ";rate=" in mime_type:
@@ -35,21 +39,39 @@ def extract_sample_rate(mime_type: str) -> int:
     return 16000  # default sample rate
 
 
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
 def convert_to_wav(pcm_data: genai_types.Blob) -> genai_types.Blob:
     """Convert raw PCM data to WAV format using rate from mime type"""
     if pcm_data.mime_type == "audio/wav":
         return pcm_data
 
     sample_rate = extract_sample_rate(pcm_data.mime_type)
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, "wb") as wav_file:
-        wav_file.setnchannels(1)  # mono
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_data.data)
-    return genai_types.Blob(data=wav_buffer.getvalue(), mime_type="audio/wav")
+    pcm = pcm_data.data or b""
+    # A canonical 44 byte header for mono 16-bit PCM, packed directly
+    # rather than going through the wave module's file interface.
+    header = _WAV_HEADER.pack(
+        b"RIFF",
+        36 + len(pcm),
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,  # byte rate
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        len(pcm),
+    )
+    return genai_types.Blob(data=header + pcm, mime_type="audio/wav")
 
 
+# Keyed on a digest of the full request, audio included. Only the in-memory
+# cache is used so user audio isn't persisted to disk.
+@default_memory_cache.cache_fn_async()
 async def transcribe(
     request: TranscribeRequest,
     model_id: str = settings.TRANSCRIPTION_MODEL_ID,
@@ -59,12 +81,13 @@ async def transcribe(
 
     buffer = io.BytesIO(audio_data.data)
     buffer.name = "audio.wav"
-    response = await atranscription(
+    response = await call_with_backoff(
+        atranscription,
         model=model_id,
         file=buffer,
         language=request.source_language if request.source_language else None,
-        response_format="verbose_json",
-        timestamp_granularities=["word"],
+        # Only the text is used, so skip the word-level timestamps
+        response_format="json",
         api_key=request.api_key,
     )
 
@@ -87,16 +110,33 @@ async def transcribe(
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _transcribe_and_hint_config(
+    today: str, practice_language: str, native_language: str
+) -> genai_types.GenerateContentConfig:
+    """Build the request config, which only varies by day and language pair"""
+    system_prompt = TRANSCRIBE_AND_HINT_PROMPT.format(
+        today=today,
+        native_language=LANGUAGES[native_language],
+        practice_language=LANGUAGES[practice_language],
+    )
+    return genai_types.GenerateContentConfig(
+        system_instruction=system_prompt,
+        response_mime_type="application/json",
+        automatic_function_calling=genai_types.AutomaticFunctionCallingConfig(
+            disable=True,
+            maximum_remote_calls=0,
+        ),
+    )
+
+
+@default_memory_cache.cache_fn_async()
+@with_backoff()
 async def transcribe_and_hint(
     request: TranscribeAndHintRequest,
 ) -> TranscribeAndHintResponse:
     """Transcribe audio and generate hints for the conversation in a single model call"""
-    practice_language = LANGUAGES[request.practice_language]
-    native_language = LANGUAGES[request.native_language]
-    client = genai.Client(
-        api_key=settings.GEMINI_API_KEY,
-        http_options={"api_version": settings.GEMINI_API_VERSION},
-    )
+    client = get_genai_client()
 
     audio_data = None
 
@@ -107,15 +147,10 @@ async def transcribe_and_hint(
             )
         )
 
-    system_prompt = (
-        "You are an expert at transcription. Transcribe this Japanese audio sample."
-    )
-
-    # Format system prompt
-    system_prompt = TRANSCRIBE_AND_HINT_PROMPT.format(
-        today=datetime.date.today().strftime("%Y-%m-%d"),
-        native_language=native_language,
-        practice_language=practice_language,
+    config = _transcribe_and_hint_config(
+        datetime.date.today().strftime("%Y-%m-%d"),
+        request.practice_language,
+        request.native_language,
     )
 
     user_content: List[genai_types.ContentUnion] = [
@@ -130,17 +165,10 @@ async def transcribe_and_hint(
             )
         )
 
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=request.model_id,
         contents=user_content,
-        config=genai_types.GenerateContentConfig(
-            system_instruction=system_prompt,
-            response_mime_type="application/json",
-            automatic_function_calling=genai_types.AutomaticFunctionCallingConfig(
-                disable=True,
-                maximum_remote_calls=0,
-            ),
-        ),
+        config=config,
     )
 
     try:
@@ -1,40 +1,66 @@
+import functools
 import logging
 
 from litellm import acompletion
 
-from multivox.cache import default_file_cache
+from multivox.cache import default_file_cache, default_memory_cache
 from multivox.types import (
     LANGUAGES,
     TranslateRequest,
     TranslateResponse,
 )
+from multivox.upstream import call_with_backoff
 
 logger = logging.getLogger(__name__)
 
 
-@default_file_cache.cache_fn_async()
+@functools.lru_cache(maxsize=256)
+def _format_prompt(template: str, source_language: str, target_language: str) -> str:
+    """Fill in a prompt template; only a few language pairs are ever used"""
+    return template.format(
+        source_language=source_language, target_language=target_language
+    )
+
+
 async def translate(
     request: TranslateRequest,
+) -> TranslateResponse:
+    if request.source_language == request.target_language:
+        # Nothing to translate, so skip the model call and the caches
+        return TranslateResponse(
+            source_text=request.text,
+            translated_text=request.text,
+            chunked=[request.text],
+            dictionary={},
+        )
+    return await _translate(request)
+
+
+@default_memory_cache.cache_fn_async()
+@default_file_cache.cache_fn_async()
+async def _translate(
+    request: TranslateRequest,
 ) -> TranslateResponse:
     source_language = LANGUAGES[request.source_language]
     target_language = LANGUAGES[request.target_language]
     logger.info("Translating text from %s to %s", request.source_language, request.target_language)
-    system_prompt = request.system_prompt.format(
-        source_language=source_language.name,
-        target_language=target_language.name,
+    system_prompt = _format_prompt(
+        request.system_prompt, source_language.name, target_language.name
     )
-    translation_prompt = request.translation_prompt.format(
-        source_language=source_language.name,
-        target_language=target_language.name,
+    translation_prompt = _format_prompt(
+        request.translation_prompt, source_language.name, target_language.name
     )
-    text = f"<input>{request.text}</input>"
+    user_prompt = f"{translation_prompt}\n<input>{request.text}</input>"
 
     messages = [
         {"role": "system", "content": system_prompt},
-        {"role": "user", "content": translation_prompt + "\n" + text}
+        {"role": "user", "content": user_prompt}
     ]
 
-    response = await acompletion(
+    # Retried inline rather than via @with_backoff: the file cache keys on the
+    # decorated function's bytecode, which must be _translate's own.
+    response = await call_with_backoff(
+        acompletion,
         model=request.model_id,
         messages=messages,
         response_format={"type": "json_object"},
@@ -1,11 +1,22 @@
+import asyncio
+import functools
+import logging
+import re
 from dataclasses import dataclass
+from typing import AsyncIterator
 
 from google.cloud import texttospeech
+from google.cloud.texttospeech_v1.services.text_to_speech.transports import (
+    TextToSpeechGrpcAsyncIOTransport,
+)
 from google.oauth2 import service_account
 
-from multivox.cache import default_file_cache
+from multivox.cache import default_file_cache, default_memory_cache
 from multivox.config import settings
 from multivox.types import Language
+from multivox.upstream import call_with_backoff, loop_local
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -15,73 +26,146 @@ class TTSAudio:
     data: bytes
 
 
-@default_file_cache.cache_fn_async()
-async def generate_tts_audio_async(term: str, language: Language) -> TTSAudio | None:
-    """Generate TTS audio for text using Google Cloud Text-to-Speech API"""
-    if not language.tts_language_code or not language.tts_voice_name:
-        return None
-
-    credentials = service_account.Credentials.from_service_account_info(
+_AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=texttospeech.AudioEncoding.MP3,
+    speaking_rate=0.8,
+    pitch=0.0,
+)
+
+# The transport's default unlimited message sizes, plus keepalive pings while
+# a synthesis call is in flight so a dead connection fails the call promptly
+# rather than hanging it. gRPC doesn't ping idle channels without
+# keepalive_permit_without_calls, which Google's frontend may answer with
+# "too many pings"; an idle channel that was dropped reconnects on next use.
+_GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials() -> service_account.Credentials:
+    return service_account.Credentials.from_service_account_info(
         settings.GOOGLE_SERVICE_ACCOUNT_INFO
     )
-    tts_client = texttospeech.TextToSpeechAsyncClient(credentials=credentials)
 
-    voice = texttospeech.VoiceSelectionParams(
-        language_code=language.tts_language_code,
-        name=language.tts_voice_name,
+
+def _new_tts_client() -> texttospeech.TextToSpeechAsyncClient:
+    channel = TextToSpeechGrpcAsyncIOTransport.create_channel(
+        credentials=_get_credentials(),
+        options=_GRPC_CHANNEL_OPTIONS,
+    )
+    return texttospeech.TextToSpeechAsyncClient(
+        transport=TextToSpeechGrpcAsyncIOTransport(channel=channel)
     )
 
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3,
-        speaking_rate=0.8,
-        pitch=0.0,
+
+async def _close_tts_client(client: texttospeech.TextToSpeechAsyncClient) -> None:
+    await client.transport.close()
+
+
+def _get_tts_client() -> texttospeech.TextToSpeechAsyncClient:
+    """Shared async client for the running event loop.
+
+    Calls reuse a warm gRPC channel; the channel is bound to the loop it was
+    created on, so each loop gets its own, as with upstream.get_genai_client.
+    """
+    return loop_local("tts_client", _new_tts_client, _close_tts_client)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tts_sync_client() -> texttospeech.TextToSpeechClient:
+    return texttospeech.TextToSpeechClient(credentials=_get_credentials())
+
+
+@functools.lru_cache(maxsize=64)
+def _voice_params(
+    language_code: str, voice_name: str
+) -> texttospeech.VoiceSelectionParams:
+    return texttospeech.VoiceSelectionParams(
+        language_code=language_code,
+        name=voice_name,
     )
 
-    synthesis_input = texttospeech.SynthesisInput(text=term)
 
-    try:
-        response = await tts_client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config,
-        )
-        return TTSAudio(text=term, data=response.audio_content)
-    except Exception as e:
-        print(f"Google TTS API error for term '{term}': {str(e)}")
-        return None
+@default_file_cache.cache_fn_async()
+async def _synthesize(term: str, language: Language) -> TTSAudio:
+    # Raises on API errors so failures are never persisted to the file cache
+    response = await call_with_backoff(
+        _get_tts_client().synthesize_speech,
+        input=texttospeech.SynthesisInput(text=term),
+        voice=_voice_params(language.tts_language_code, language.tts_voice_name),
+        audio_config=_AUDIO_CONFIG,
+    )
+    return TTSAudio(text=term, data=response.audio_content)
 
 
-@default_file_cache.cache_fn()
-def generate_tts_audio_sync(term: str, language: Language) -> TTSAudio | None:
+# Failures are returned as None and so held in the memory cache for its TTL,
+# rather than retried against the API on every request for the same term.
+@default_memory_cache.cache_fn_async()
+async def generate_tts_audio_async(term: str, language: Language) -> TTSAudio | None:
     """Generate TTS audio for text using Google Cloud Text-to-Speech API"""
     if not language.tts_language_code or not language.tts_voice_name:
         return None
 
-    credentials = service_account.Credentials.from_service_account_info(
-        settings.GOOGLE_SERVICE_ACCOUNT_INFO
-    )
-    tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+    try:
+        return await _synthesize(term, language)
+    except Exception:
+        logger.exception("Google TTS API error for term %r", term)
+        return None
+
+
+# Sentence boundaries: Latin punctuation followed by whitespace, or CJK
+# punctuation, which is not.
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences for incremental synthesis"""
+    return [s for s in (p.strip() for p in _SENTENCE_END.split(text)) if s]
 
-    voice = texttospeech.VoiceSelectionParams(
-        language_code=language.tts_language_code,
-        name=language.tts_voice_name,
-    )
 
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3,
-        speaking_rate=0.8,
-        pitch=0.0,
+async def generate_tts_audio_stream(
+    text: str, language: Language
+) -> AsyncIterator[bytes]:
+    """Generate TTS audio for text sentence by sentence, yielding MP3 chunks in order.
+
+    Sentences are synthesized concurrently, so the first chunk is available
+    as soon as the first sentence is ready rather than the whole text.
+    """
+    tasks = [
+        asyncio.create_task(generate_tts_audio_async(sentence, language))
+        for sentence in split_sentences(text)
+    ]
+    try:
+        for task in tasks:
+            audio = await task
+            if audio:
+                yield audio.data
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@default_file_cache.cache_fn()
+def _synthesize_sync(term: str, language: Language) -> TTSAudio:
+    response = _get_tts_sync_client().synthesize_speech(
+        input=texttospeech.SynthesisInput(text=term),
+        voice=_voice_params(language.tts_language_code, language.tts_voice_name),
+        audio_config=_AUDIO_CONFIG,
     )
+    return TTSAudio(text=term, data=response.audio_content)
 
-    synthesis_input = texttospeech.SynthesisInput(text=term)
+
+def generate_tts_audio_sync(term: str, language: Language) -> TTSAudio | None:
+    """Generate TTS audio for text using Google Cloud Text-to-Speech API"""
+    if not language.tts_language_code or not language.tts_voice_name:
+        return None
 
     try:
-        response = tts_client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config,
-        )
-        return TTSAudio(text=term, data=response.audio_content)
-    except Exception as e:
-        print(f"Google TTS API error for term '{term}': {str(e)}")
+        return _synthesize_sync(term, language)
+    except Exception:
+        logger.exception("Google TTS API error for term %r", term)
         return None
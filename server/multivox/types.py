@@ -1,13 +1,40 @@
+import base64
 import time
 from enum import Enum
 from typing import Annotated, Literal, Optional, Union
 
-from pydantic import Base64Bytes, BaseModel, Discriminator, Field, RootModel
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Discriminator,
+    Field,
+    PlainSerializer,
+    TypeAdapter,
+)
 
 from multivox.config import settings
 from multivox.prompts import HINT_PROMPT, TRANSLATION_PROMPT, TRANSLATION_SYSTEM_PROMPT
 
 
+def _decode_base64(value):
+    if isinstance(value, str):
+        return base64.b64decode(value)
+    return value
+
+
+# Audio is kept as raw bytes in memory and only base64 encoded at the JSON
+# boundary. Base64 strings are decoded on input; bytes are taken as-is.
+AudioBytes = Annotated[
+    bytes,
+    BeforeValidator(_decode_base64),
+    PlainSerializer(
+        lambda audio: base64.b64encode(audio).decode("ascii"),
+        return_type=str,
+        when_used="json",
+    ),
+]
+
+
 class Language(BaseModel):
     abbreviation: str
     name: str
@@ -145,7 +172,7 @@ class DictionaryEntry(BaseModel):
 
 class TranscribeRequest(BaseModel):
     api_key: Optional[str] = None
-    audio: Optional[Base64Bytes] = None
+    audio: Optional[AudioBytes] = None
     mime_type: Optional[str] = None
     sample_rate: Optional[int] = None
     source_language: str = ""
@@ -157,7 +184,7 @@ class TranscribeRequest(BaseModel):
 class TranscribeAndHintRequest(BaseModel):
     scenario: str
     history: str
-    audio: Optional[Base64Bytes] = None
+    audio: Optional[AudioBytes] = None
     mime_type: Optional[str] = None
     practice_language: str
     native_language: str
@@ -267,9 +294,14 @@ class TranscriptionWebSocketMessage(BaseWebSocketMessage):
 
 class AudioWebSocketMessage(BaseWebSocketMessage):
     type: Literal[MessageType.AUDIO] = MessageType.AUDIO
-    audio: Base64Bytes
+    audio: AudioBytes
     mime_type: str
 
+    @classmethod
+    def from_raw(cls, audio: bytes, **kwargs) -> "AudioWebSocketMessage":
+        """Wrap raw audio, skipping validation of the payload."""
+        return cls.model_construct(audio=audio, **kwargs)
+
 
 class HintWebSocketMessage(BaseWebSocketMessage):
     type: Literal[MessageType.HINT] = MessageType.HINT
@@ -305,15 +337,18 @@ WebSocketMessage = Annotated[
     Discriminator("type"),
 ]
 
-WebSocketRoot = RootModel[WebSocketMessage]
+# Validates the union directly, without boxing each message in a RootModel
+_WEBSOCKET_MESSAGE_ADAPTER: TypeAdapter[WebSocketMessage] = TypeAdapter(
+    WebSocketMessage
+)
 
 
 def parse_websocket_message_dict(data: dict) -> WebSocketMessage:
-    return WebSocketRoot.model_validate(data).root
+    return _WEBSOCKET_MESSAGE_ADAPTER.validate_python(data)
 
 
 def parse_websocket_message_bytes(data: bytes | str) -> WebSocketMessage:
-    return WebSocketRoot.model_validate_json(data).root
+    return _WEBSOCKET_MESSAGE_ADAPTER.validate_json(data)
 
 
 class ChatMessage(BaseModel):
@@ -0,0 +1,140 @@
+import asyncio
+import functools
+import logging
+import random
+from typing import Any, Awaitable, Callable, Hashable, cast
+
+from google import genai
+
+from multivox.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Clients, pools and semaphores are bound to the event loop they are first
+# used on, so shared instances are kept per loop. The server runs a single
+# loop per worker; tests start a new loop per TestClient session.
+#
+# The values hold references to their loop, so weak keys wouldn't release
+# them; instead entries for loops which have since closed are dropped when a
+# new loop first registers a value.
+_loop_locals: dict[
+    asyncio.AbstractEventLoop,
+    dict[Hashable, tuple[Any, Callable[[Any], Awaitable[None]] | None]],
+] = {}
+
+
+def loop_local[T](
+    key: Hashable,
+    factory: Callable[[], T],
+    close: Callable[[T], Awaitable[None]] | None = None,
+) -> T:
+    """Shared value for `key` on the running event loop, created on first use.
+
+    `close` is awaited on the value by `close_loop_locals`.
+    """
+    loop = asyncio.get_running_loop()
+    values = _loop_locals.get(loop)
+    if values is None:
+        for closed in [other for other in _loop_locals if other.is_closed()]:
+            del _loop_locals[closed]
+        values = _loop_locals[loop] = {}
+    if key not in values:
+        values[key] = (factory(), close)
+    return values[key][0]
+
+
+async def close_loop_locals() -> None:
+    """Close and forget the shared values created on the running event loop"""
+    values = _loop_locals.pop(asyncio.get_running_loop(), {})
+    for key, (value, close) in values.items():
+        if close is None:
+            continue
+        try:
+            await close(value)
+        except Exception:
+            logger.exception("Failed to close %s", key)
+
+
+def _upstream_semaphore() -> asyncio.Semaphore:
+    # Shared by every call to the model / TTS APIs, which draw on the same quota
+    return loop_local(
+        "upstream_semaphore",
+        lambda: asyncio.Semaphore(settings.MAX_CONCURRENT_UPSTREAM),
+    )
+
+
+def _new_genai_client(api_key: str) -> genai.Client:
+    return genai.Client(
+        api_key=api_key,
+        http_options={"api_version": settings.GEMINI_API_VERSION},
+    )
+
+
+async def _close_genai_client(client: genai.Client) -> None:
+    await client.aio.aclose()
+
+
+def get_genai_client(api_key: str = settings.GEMINI_API_KEY) -> genai.Client:
+    """Shared Gemini client for an API key on the running event loop.
+
+    Reusing the client keeps its HTTP connection pool warm across calls and
+    sessions instead of paying a TLS handshake per request.
+    """
+    return loop_local(
+        ("genai_client", api_key),
+        functools.partial(_new_genai_client, api_key),
+        _close_genai_client,
+    )
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """Whether an upstream error is a quota / rate limit rejection"""
+    # google-genai and google-api-core errors carry the HTTP status as `code`,
+    # litellm errors as `status_code`.
+    return any(getattr(exc, attr, None) == 429 for attr in ("code", "status_code"))
+
+
+async def call_with_backoff(
+    fn: Callable[..., Awaitable[Any]],
+    *args: Any,
+    max_retries: int = 3,
+    base: float = 0.5,
+    cap: float = 8.0,
+    **kwargs: Any,
+) -> Any:
+    """Call an upstream API, limiting concurrency and retrying rate limit errors.
+
+    The semaphore is only held while a request is in flight, not while
+    waiting to retry.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            async with _upstream_semaphore():
+                return await fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries or not is_rate_limited(e):
+                raise
+            delay = min(cap, base * 2**attempt) + random.uniform(0, base)
+            logger.warning(
+                "Rate limited calling %s, retrying in %.1fs",
+                getattr(fn, "__qualname__", fn),
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+
+def with_backoff[
+    F: Callable[..., Awaitable[Any]]
+](max_retries: int = 3, base: float = 0.5, cap: float = 8.0) -> Callable[[F], F]:
+    """Decorator form of `call_with_backoff`"""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            return await call_with_backoff(
+                func, *args, max_retries=max_retries, base=base, cap=cap, **kwargs
+            )
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from multivox import cache
+from multivox.cache import MemoryCache
+
+
+class Counted:
+    """Async callable that records how often it runs"""
+
+    def __init__(self, result: str = "value", delay: float = 0):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+async def test_concurrent_calls_share_one_request():
+    """Callers arriving while a call is in flight should await the same call"""
+    memory = MemoryCache()
+    fn = Counted(delay=0.05)
+
+    results = await asyncio.gather(*(memory.get_or_call("key", fn) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert fn.calls == 1
+
+
+async def test_completed_result_is_reused():
+    """A finished call should be served from the cache"""
+    memory = MemoryCache()
+    fn = Counted()
+
+    assert await memory.get_or_call("key", fn) == "value"
+    assert await memory.get_or_call("key", fn) == "value"
+    assert fn.calls == 1
+
+
+async def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch):
+    """Entries older than the TTL should be recomputed"""
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    memory = MemoryCache(ttl=10)
+    fn = Counted()
+
+    await memory.get_or_call("key", fn)
+    now += 5
+    await memory.get_or_call("key", fn)
+    assert fn.calls == 1
+
+    now += 10
+    await memory.get_or_call("key", fn)
+    assert fn.calls == 2
+
+
+async def test_least_recently_used_entry_is_evicted():
+    """Going over maxsize should evict the entry used longest ago"""
+    memory = MemoryCache(maxsize=2)
+    a, b, c = Counted("a"), Counted("b"), Counted("c")
+
+    await memory.get_or_call("a", a)
+    await memory.get_or_call("b", b)
+    # Touch "a" so "b" becomes the least recently used
+    await memory.get_or_call("a", a)
+    await memory.get_or_call("c", c)
+
+    await memory.get_or_call("a", a)
+    await memory.get_or_call("b", b)
+    assert a.calls == 1
+    assert b.calls == 2
+    assert c.calls == 1
+
+
+async def test_failed_calls_are_not_cached():
+    """A call that raises should be retried on the next request"""
+    memory = MemoryCache()
+    attempts = 0
+
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("upstream failed")
+        return "value"
+
+    with pytest.raises(RuntimeError):
+        await memory.get_or_call("key", flaky)
+    assert await memory.get_or_call("key", flaky) == "value"
+    assert attempts == 2
+
+
+async def test_cancelling_one_caller_keeps_shared_call():
+    """Cancelling one waiter shouldn't cancel the call for the others"""
+    memory = MemoryCache()
+    fn = Counted(delay=0.05)
+
+    first = asyncio.create_task(memory.get_or_call("key", fn))
+    second = asyncio.create_task(memory.get_or_call("key", fn))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+    assert first.cancelled()
+    assert fn.calls == 1
+
+
+async def test_cancelled_calls_are_not_cached():
+    """Cancelling every waiter should cancel the call and drop its entry"""
+    memory = MemoryCache()
+    cancelled = asyncio.Event()
+
+    async def slow() -> str:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "stale"
+
+    waiter = asyncio.create_task(memory.get_or_call("key", slow))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    fn = Counted()
+    assert await memory.get_or_call("key", fn) == "value"
+    assert fn.calls == 1
+
+
+async def test_decorator_keys_on_arguments():
+    """The decorator should cache per distinct set of arguments"""
+    memory = MemoryCache()
+    calls: list[tuple[str, str]] = []
+
+    @memory.cache_fn_async()
+    async def greet(name: str, greeting: str = "hello") -> str:
+        calls.append((name, greeting))
+        return f"{greeting} {name}"
+
+    assert await greet("ana") == "hello ana"
+    assert await greet("ana") == "hello ana"
+    assert await greet("ana", greeting="hi") == "hi ana"
+    assert await greet("ben") == "hello ben"
+    assert calls == [("ana", "hello"), ("ana", "hi"), ("ben", "hello")]
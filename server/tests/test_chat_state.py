@@ -0,0 +1,249 @@
+import asyncio
+
+import pytest
+
+from multivox import tasks
+from multivox.cache import MemoryCache
+from multivox.message_socket import TypedWebSocket
+from multivox.tasks import ChatState, MessageSubscriber
+from multivox.types import (
+    ErrorWebSocketMessage,
+    MessageRole,
+    MessageType,
+    TextWebSocketMessage,
+    WebSocketMessage,
+)
+
+
+def make_state() -> ChatState:
+    return ChatState(modality="text", user_ws=TypedWebSocket(None), session=None)  # type: ignore
+
+
+def text(role: MessageRole, body: str = "hi") -> TextWebSocketMessage:
+    return TextWebSocketMessage(text=body, role=role, end_of_turn=True)
+
+
+class Recorder(MessageSubscriber):
+    """Subscriber which records the messages delivered to it"""
+
+    def __init__(self):
+        self.received: list[WebSocketMessage] = []
+
+    async def handle_message(self, message: WebSocketMessage) -> None:
+        self.received.append(message)
+
+
+async def test_close_cancels_history_compaction(monkeypatch: pytest.MonkeyPatch):
+    """Closing the state should stop an in-flight history summarization"""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def summarize_history(history: str) -> str:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "summary"
+
+    monkeypatch.setattr(tasks.settings, "MAX_HISTORY_TURNS", 1)
+    monkeypatch.setattr(tasks, "summarize_history", summarize_history)
+
+    state = make_state()
+    for i in range(3):
+        state.record(text(MessageRole.USER, f"turn {i}"))
+    await asyncio.wait_for(started.wait(), 1)
+
+    await state.close()
+    assert cancelled.is_set()
+    assert state._compaction is None
+
+
+async def test_close_cancels_cached_summarization(monkeypatch: pytest.MonkeyPatch):
+    """The memory cache shouldn't keep a summarization running nobody awaits"""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    @MemoryCache().cache_fn_async()
+    async def summarize_history(history: str) -> str:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "summary"
+
+    monkeypatch.setattr(tasks.settings, "MAX_HISTORY_TURNS", 1)
+    monkeypatch.setattr(tasks, "summarize_history", summarize_history)
+
+    state = make_state()
+    for i in range(3):
+        state.record(text(MessageRole.USER, f"turn {i}"))
+    await asyncio.wait_for(started.wait(), 1)
+
+    await state.close()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_dispatch_filters_by_role_and_type():
+    """Subscribers should only receive the roles and types they asked for"""
+    state = make_state()
+    everything = Recorder()
+    user_only = Recorder()
+    errors_only = Recorder()
+    state.add_subscriber(everything)
+    state.add_subscriber(user_only, roles={MessageRole.USER})
+    state.add_subscriber(errors_only, types={MessageType.ERROR})
+
+    user_text = text(MessageRole.USER)
+    assistant_text = text(MessageRole.ASSISTANT)
+    error = ErrorWebSocketMessage(role=MessageRole.SYSTEM, text="boom")
+    for message in (user_text, assistant_text, error):
+        await state.dispatch(message)
+
+    assert everything.received == [user_text, assistant_text, error]
+    assert user_only.received == [user_text]
+    assert errors_only.received == [error]
+
+
+async def test_dispatch_calls_registered_handlers():
+    """A `handlers` mapping should route each type to its own method"""
+    state = make_state()
+    texts: list[WebSocketMessage] = []
+    errors: list[WebSocketMessage] = []
+
+    async def on_text(message: WebSocketMessage) -> None:
+        texts.append(message)
+
+    async def on_error(message: WebSocketMessage) -> None:
+        errors.append(message)
+
+    subscriber = Recorder()
+    state.add_subscriber(
+        subscriber,
+        roles={MessageRole.USER},
+        handlers={MessageType.TEXT: on_text, MessageType.ERROR: on_error},
+    )
+
+    user_text = text(MessageRole.USER)
+    error = ErrorWebSocketMessage(role=MessageRole.USER, text="boom")
+    await state.dispatch(user_text)
+    await state.dispatch(error)
+    await state.dispatch(text(MessageRole.ASSISTANT))
+
+    assert texts == [user_text]
+    assert errors == [error]
+    assert subscriber.received == []
+
+
+async def test_publish_only_subscriber_receives_nothing():
+    """Subscribing with no types registers the subscriber without routing to it"""
+    state = make_state()
+    publisher = Recorder()
+    state.add_subscriber(publisher, types=())
+
+    await state.handle_message(text(MessageRole.USER))
+
+    assert publisher in state.subscribers
+    assert publisher.received == []
+
+
+async def test_dispatch_runs_handlers_concurrently():
+    """Handlers for the same message should run at the same time"""
+    state = make_state()
+    arrived = 0
+    all_arrived = asyncio.Event()
+
+    async def handler(message: WebSocketMessage) -> None:
+        nonlocal arrived
+        arrived += 1
+        if arrived == 3:
+            all_arrived.set()
+        # Deadlocks unless every handler is running at once
+        await all_arrived.wait()
+
+    for _ in range(3):
+        state.add_subscriber(Recorder(), handlers={MessageType.TEXT: handler})
+
+    await asyncio.wait_for(state.dispatch(text(MessageRole.USER)), 1)
+    assert arrived == 3
+
+
+async def test_dispatch_cancels_slow_handlers(monkeypatch: pytest.MonkeyPatch):
+    """A handler which times out should be cancelled without holding up others"""
+    monkeypatch.setattr(tasks, "_DISPATCH_TIMEOUT", 0.05)
+    state = make_state()
+    cancelled = asyncio.Event()
+
+    async def slow(message: WebSocketMessage) -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    fast = Recorder()
+    state.add_subscriber(Recorder(), handlers={MessageType.TEXT: slow})
+    state.add_subscriber(fast)
+
+    message = text(MessageRole.USER)
+    await asyncio.wait_for(state.dispatch(message), 1)
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert fast.received == [message]
+
+
+async def test_dispatch_times_out_single_handler(monkeypatch: pytest.MonkeyPatch):
+    """The single-subscriber path should also give up on a slow handler"""
+    monkeypatch.setattr(tasks, "_DISPATCH_TIMEOUT", 0.05)
+    state = make_state()
+
+    async def slow(message: WebSocketMessage) -> None:
+        await asyncio.sleep(60)
+
+    state.add_subscriber(Recorder(), handlers={MessageType.TEXT: slow})
+    await asyncio.wait_for(state.dispatch(text(MessageRole.USER)), 1)
+
+
+async def test_dispatch_isolates_handler_errors():
+    """An exception in one handler shouldn't stop the others"""
+    state = make_state()
+
+    async def broken(message: WebSocketMessage) -> None:
+        raise RuntimeError("handler failed")
+
+    working = Recorder()
+    state.add_subscriber(Recorder(), handlers={MessageType.TEXT: broken})
+    state.add_subscriber(working)
+
+    message = text(MessageRole.USER)
+    await state.dispatch(message)
+    assert working.received == [message]
+
+
+async def test_cancelled_dispatch_cancels_handlers():
+    """Handlers shouldn't keep running once the dispatching caller is cancelled"""
+    state = make_state()
+    started = 0
+    cancelled = 0
+
+    async def slow(message: WebSocketMessage) -> None:
+        nonlocal started, cancelled
+        started += 1
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    for _ in range(2):
+        state.add_subscriber(Recorder(), handlers={MessageType.TEXT: slow})
+
+    dispatch = asyncio.create_task(state.dispatch(text(MessageRole.USER)))
+    while started < 2:
+        await asyncio.sleep(0)
+    dispatch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await dispatch
+    assert cancelled == 2
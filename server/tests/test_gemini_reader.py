@@ -0,0 +1,108 @@
+import asyncio
+
+from google.genai import types as genai_types
+
+from multivox.message_socket import TypedWebSocket
+from multivox.tasks import ChatState, GeminiReaderTask, MessageSubscriber
+from multivox.types import (
+    AudioWebSocketMessage,
+    MessageType,
+    TextWebSocketMessage,
+    WebSocketMessage,
+)
+
+
+def audio(data: bytes, turn_complete: bool = False) -> genai_types.LiveServerMessage:
+    part = genai_types.Part(
+        inline_data=genai_types.Blob(data=data, mime_type="audio/pcm")
+    )
+    return genai_types.LiveServerMessage(
+        server_content=genai_types.LiveServerContent(
+            model_turn=genai_types.Content(parts=[part]),
+            turn_complete=turn_complete,
+        )
+    )
+
+
+def text(body: str) -> genai_types.LiveServerMessage:
+    return genai_types.LiveServerMessage(
+        server_content=genai_types.LiveServerContent(
+            model_turn=genai_types.Content(parts=[genai_types.Part(text=body)]),
+        )
+    )
+
+
+class FakeSession:
+    """Live session replaying scripted responses, with pauses given as floats"""
+
+    def __init__(self, script: list[genai_types.LiveServerMessage | float]):
+        self.script = script
+        self.reader: GeminiReaderTask | None = None
+
+    async def receive(self):
+        for item in self.script:
+            if isinstance(item, float):
+                await asyncio.sleep(item)
+            else:
+                yield item
+        # The session is over once the script runs out
+        assert self.reader is not None
+        self.reader.stop()
+
+
+class Recorder(MessageSubscriber):
+    """Subscriber which records the messages delivered to it"""
+
+    def __init__(self):
+        self.received: list[WebSocketMessage] = []
+
+    async def handle_message(self, message: WebSocketMessage) -> None:
+        self.received.append(message)
+
+
+async def run_reader(script: list) -> list[WebSocketMessage]:
+    """Run a reader over a scripted session, returning what it published"""
+    session = FakeSession(script)
+    state = ChatState(modality="audio", user_ws=TypedWebSocket(None), session=None)  # type: ignore
+    recorder = Recorder()
+    state.add_subscriber(recorder, types={MessageType.AUDIO, MessageType.TEXT})
+    session.reader = GeminiReaderTask(state, session)  # type: ignore
+    tasks = await session.reader.start()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    return recorder.received
+
+
+def summarize(messages: list[WebSocketMessage]) -> list[tuple]:
+    summary: list[tuple] = []
+    for message in messages:
+        if isinstance(message, AudioWebSocketMessage):
+            summary.append(("audio", message.audio, message.end_of_turn))
+        elif isinstance(message, TextWebSocketMessage):
+            summary.append(("text", message.text, message.end_of_turn))
+    return summary
+
+
+async def test_reader_coalesces_audio_within_window():
+    """Chunks arriving within the window merge; a pause or end of turn flushes"""
+    received = await run_reader(
+        [audio(b"a"), audio(b"b"), 0.1, audio(b"c"), audio(b"d", turn_complete=True)]
+    )
+    assert summarize(received) == [
+        ("audio", b"ab", False),
+        ("audio", b"cd", True),
+    ]
+
+
+async def test_reader_flushes_audio_before_text():
+    """Buffered audio is published ahead of a following text response"""
+    received = await run_reader([audio(b"a"), text("hi"), 0.1])
+    assert summarize(received) == [
+        ("audio", b"a", False),
+        ("text", "hi", False),
+    ]
+
+
+async def test_reader_flushes_audio_when_session_ends():
+    """Audio still buffered when the session ends closes the turn"""
+    received = await run_reader([audio(b"a"), audio(b"b")])
+    assert summarize(received) == [("audio", b"ab", True)]
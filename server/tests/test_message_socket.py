@@ -0,0 +1,55 @@
+from multivox.message_socket import (
+    decode_audio_frame,
+    decode_text_frame,
+    encode_audio_frame,
+    encode_batch_frames,
+)
+from multivox.types import (
+    AudioWebSocketMessage,
+    MessageRole,
+    ProcessingWebSocketMessage,
+    TextWebSocketMessage,
+)
+
+
+def test_audio_frame_roundtrip():
+    """Binary audio frames should carry the raw audio and all message metadata"""
+    audio = bytes(range(256)) * 4
+    message = AudioWebSocketMessage.from_raw(
+        audio=audio,
+        role=MessageRole.ASSISTANT,
+        end_of_turn=True,
+        mime_type="audio/pcm;rate=24000",
+    )
+
+    frame = encode_audio_frame(message)
+    assert frame.endswith(audio)
+
+    decoded = decode_audio_frame(frame)
+    assert decoded == message
+
+
+def test_batch_frame_roundtrip():
+    """Batched text frames should decode back into the original messages"""
+    messages = [
+        TextWebSocketMessage(text="こんにちは", role=MessageRole.ASSISTANT),
+        ProcessingWebSocketMessage(status="completed"),
+    ]
+
+    (frame,) = encode_batch_frames(messages)
+    assert decode_text_frame(frame) == messages
+    (frame,) = encode_batch_frames(messages[:1])
+    assert decode_text_frame(frame) == messages[:1]
+
+
+def test_batch_frames_split_at_size_limit():
+    """Runs of messages should be split into frames under the size limit"""
+    messages = [
+        TextWebSocketMessage(text="x" * 100, role=MessageRole.ASSISTANT)
+        for _ in range(10)
+    ]
+
+    frames = list(encode_batch_frames(messages, max_bytes=500))
+    assert len(frames) > 1
+    assert all(len(frame) <= 500 for frame in frames)
+    assert [m for frame in frames for m in decode_text_frame(frame)] == messages
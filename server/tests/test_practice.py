@@ -10,6 +10,7 @@ from typing import Callable, List, Optional
 
 from fastapi.testclient import TestClient
 from multivox.app import app
+from multivox.message_socket import decode_audio_frame, decode_text_frame
 from multivox.types import (
     AudioWebSocketMessage,
     InitializeWebSocketMessage,
@@ -18,7 +19,6 @@ from multivox.types import (
     TextWebSocketMessage,
     TranslateResponse,
     WebSocketMessage,
-    parse_websocket_message_bytes,
 )
 from tests.test_translate import INSTRUCTIONS
 
@@ -59,15 +59,20 @@ class WebSocketPoller:
         logging.info("Started collecting messages.")
         while self.running:
             try:
-                # Receive message from websocket
-                data = self.websocket.receive_text()
-                msg = parse_websocket_message_bytes(data)
-
-                self.message_queue.put(msg)
-
-                logging.info(
-                    f"{self.thread.ident} -- Received message type: {msg.type}"
-                )
+                # Receive message from websocket; audio arrives as binary
+                # frames and other messages may be batched together
+                data = self.websocket.receive()
+                if data.get("bytes") is not None:
+                    msgs = [decode_audio_frame(data["bytes"])]
+                else:
+                    msgs = decode_text_frame(data["text"])
+
+                for msg in msgs:
+                    self.message_queue.put(msg)
+
+                    logging.info(
+                        f"{self.thread.ident} -- Received message type: {msg.type}"
+                    )
 
             except Exception as e:
                 if self.running:  # Only log if we're still supposed to be running
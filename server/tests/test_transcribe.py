@@ -1,12 +1,27 @@
+import asyncio
 import base64
+import io
 import pathlib
+import threading
+import time
+import wave
 
 import pytest
 from fastapi.testclient import TestClient
 from google.genai import types as genai_types
+from multivox import tasks
 from multivox.app import app
-from multivox.transcribe import transcribe_and_hint
-from multivox.types import Language, TranscribeAndHintRequest, TranscribeResponse
+from multivox.config import settings
+from multivox.message_socket import TypedWebSocket
+from multivox.tasks import ChatState, TranscribeAndHintTask, _vad_scan, get_vad_model
+from multivox.transcribe import convert_to_wav, transcribe_and_hint
+from multivox.types import (
+    AudioWebSocketMessage,
+    Language,
+    MessageRole,
+    TranscribeAndHintRequest,
+    TranscribeResponse,
+)
 
 
 @pytest.fixture
@@ -56,7 +71,7 @@ async def test_transcribe_and_hint_conversation_flow(
         TranscribeAndHintRequest(
             scenario=scenario,
             history=history,
-            audio=base64.b64encode(checkin.data),
+            audio=checkin.data,
             mime_type=checkin.mime_type,
             practice_language=practice_lang.abbreviation,
             native_language=native_lang.abbreviation,
@@ -80,7 +95,7 @@ async def test_transcribe_and_hint_conversation_flow(
         TranscribeAndHintRequest(
             scenario=scenario,
             history=history,
-            audio=base64.b64encode(namae_wa.data),
+            audio=namae_wa.data,
             mime_type=namae_wa.mime_type,
             practice_language=practice_lang.abbreviation,
             native_language=native_lang.abbreviation,
@@ -135,3 +150,113 @@ def test_transcribe_endpoint(sample_rate):
     assert transcription.translated_text
 
     print(f"Transcription at {sample_rate} Hz: {data}")
+
+
+def read_pcm(name: str) -> bytes:
+    """Read a test WAV file as raw PCM"""
+    with open(pathlib.Path(__file__).parent / "data" / name, "rb") as f:
+        # Skip WAV header (44 bytes)
+        f.seek(44)
+        return f.read()
+
+
+async def test_incremental_vad_matches_full_scan(
+    languages: tuple[Language, Language],
+) -> None:
+    """Scanning a stream chunk by chunk should find the same end of speech as
+    scanning the whole buffer at once"""
+    silence = bytes(2 * settings.CLIENT_SAMPLE_RATE)
+    audio = read_pcm("checkin.wav") + silence + read_pcm("namae_wa.wav") + silence
+
+    vad_model = get_vad_model()
+    state = ChatState(modality="audio", user_ws=TypedWebSocket(None), session=None)  # type: ignore
+    task = TranscribeAndHintTask(state, *languages, client=None, vad_model=vad_model)  # type: ignore
+
+    # Feed 100ms chunks, as the client streams them
+    chunk_size = settings.CLIENT_SAMPLE_RATE // 5
+    for i in range(0, len(audio), chunk_size):
+        task.buffer.add_audio(audio[i : i + chunk_size])
+        await task._scan_for_speech()
+    assert task.buffer.vad_cursor == len(audio)
+
+    timestamps = _vad_scan(vad_model, audio)
+    assert timestamps
+    # Silero's recurrent state depends on the audio preceding the speech, so
+    # windowed scans drift slightly; stay well inside the 1s end of turn margin.
+    assert task.buffer.last_speech_end is not None
+    drift = abs(task.buffer.last_speech_end - timestamps[-1]["end"])
+    assert drift < settings.CLIENT_SAMPLE_RATE // 2
+
+
+async def test_vad_scans_never_overlap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Scans of the shared model stay serialized even if a caller is cancelled
+    while its worker thread is still running"""
+    guard = threading.Lock()
+    active = 0
+    peak = 0
+
+    def get_speech_timestamps(audio, model, **kwargs) -> list[dict]:
+        nonlocal active, peak
+        with guard:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with guard:
+            active -= 1
+        return []
+
+    monkeypatch.setattr(tasks, "get_speech_timestamps", get_speech_timestamps)
+    pcm = bytes(settings.CLIENT_SAMPLE_RATE)
+
+    # Cancel the first scan's caller, as the dispatch timeout would
+    first = asyncio.create_task(asyncio.to_thread(_vad_scan, None, pcm))  # type: ignore
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.gather(
+        *(asyncio.to_thread(_vad_scan, None, pcm) for _ in range(3))  # type: ignore
+    )
+    assert peak == 1
+
+
+async def test_client_end_of_turn_skips_vad(
+    monkeypatch: pytest.MonkeyPatch,
+    languages: tuple[Language, Language],
+) -> None:
+    """A turn the client ended completes without waiting on VAD"""
+
+    def failing_scan(vad_model, pcm: bytes) -> list[dict]:
+        raise AssertionError("VAD should not run")
+
+    monkeypatch.setattr(tasks, "_vad_scan", failing_scan)
+    state = ChatState(modality="audio", user_ws=TypedWebSocket(None), session=None)  # type: ignore
+    task = TranscribeAndHintTask(state, *languages, client=None, vad_model=None)  # type: ignore
+
+    audio = bytes(4 * settings.CLIENT_SAMPLE_RATE)
+    await task._on_audio(
+        AudioWebSocketMessage.from_raw(
+            audio=audio,
+            role=MessageRole.USER,
+            end_of_turn=True,
+            mime_type="audio/pcm",
+        )
+    )
+    assert task._turns.get_nowait() == audio
+
+
+@pytest.mark.parametrize("sample_rate", [16000, 24000, 44100])
+def test_convert_to_wav_matches_wave_module(sample_rate: int) -> None:
+    """The packed WAV header should match what the wave module writes"""
+    pcm = read_pcm("checkin.wav")
+
+    expected = io.BytesIO()
+    with wave.open(expected, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+
+    blob = convert_to_wav(
+        genai_types.Blob(data=pcm, mime_type=f"audio/pcm;rate={sample_rate}")
+    )
+    assert blob.mime_type == "audio/wav"
+    assert blob.data == expected.getvalue()
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from multivox import tasks, tts
+from multivox.message_socket import TypedWebSocket
+from multivox.tasks import ChatState, MessageSubscriber, TranscribeAndHintTask
+from multivox.tts import TTSAudio, generate_tts_audio_stream, split_sentences
+from multivox.types import (
+    LANGUAGES,
+    AudioWebSocketMessage,
+    Language,
+    MessageRole,
+    MessageType,
+    WebSocketMessage,
+)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Hello there. How are you?", ["Hello there.", "How are you?"]),
+        ("Wait! Really?  Yes.", ["Wait!", "Really?", "Yes."]),
+        ("No punctuation", ["No punctuation"]),
+        ("version 1.5 is out", ["version 1.5 is out"]),
+        ("こんにちは。元気ですか？はい！", ["こんにちは。", "元気ですか？", "はい！"]),
+        ("", []),
+    ],
+)
+def test_split_sentences(text: str, expected: list[str]):
+    """Sentences should split on Latin punctuation plus whitespace, and on CJK
+    punctuation alone"""
+    assert split_sentences(text) == expected
+
+
+async def test_tts_stream_yields_sentences_in_order(monkeypatch: pytest.MonkeyPatch):
+    """Sentences are synthesized concurrently but yielded in text order, with
+    failed sentences skipped"""
+    delays = {"One.": 0.05, "Two.": 0, "Three.": 0.01}
+    running = 0
+    peak = 0
+
+    async def synthesize(term: str, language: Language) -> TTSAudio | None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delays.get(term, 0))
+        running -= 1
+        if term == "Broken.":
+            return None
+        return TTSAudio(text=term, data=term.encode())
+
+    monkeypatch.setattr(tts, "generate_tts_audio_async", synthesize)
+
+    chunks = [
+        chunk
+        async for chunk in generate_tts_audio_stream(
+            "One. Broken. Two. Three.", LANGUAGES["ja"]
+        )
+    ]
+    assert chunks == [b"One.", b"Two.", b"Three."]
+    assert peak == 4
+
+
+class Recorder(MessageSubscriber):
+    """Subscriber which records the messages delivered to it"""
+
+    def __init__(self):
+        self.received: list[WebSocketMessage] = []
+
+    async def handle_message(self, message: WebSocketMessage) -> None:
+        self.received.append(message)
+
+
+async def _send_tts(
+    monkeypatch: pytest.MonkeyPatch, stream
+) -> list[AudioWebSocketMessage]:
+    """Run a TTS turn with a fake stream, returning the audio messages sent"""
+    monkeypatch.setattr(tasks, "generate_tts_audio_stream", stream)
+    state = ChatState(modality="audio", user_ws=TypedWebSocket(None), session=None)  # type: ignore
+    recorder = Recorder()
+    state.add_subscriber(recorder, types={MessageType.AUDIO})
+    task = TranscribeAndHintTask(
+        state, LANGUAGES["ja"], LANGUAGES["en"], client=None, vad_model=None  # type: ignore
+    )
+    await task._generate_and_send_tts("こんにちは。元気ですか？")
+    return [m for m in recorder.received if isinstance(m, AudioWebSocketMessage)]
+
+
+async def test_tts_turn_ends_with_empty_chunk(monkeypatch: pytest.MonkeyPatch):
+    """Streamed TTS chunks are followed by an empty chunk closing the turn"""
+
+    async def stream(text: str, language: Language):
+        for chunk in (b"first", b"second"):
+            yield chunk
+
+    messages = await _send_tts(monkeypatch, stream)
+    assert [m.audio for m in messages] == [b"first", b"second", b""]
+    assert [m.end_of_turn for m in messages] == [False, False, True]
+    assert all(m.role == MessageRole.ASSISTANT for m in messages)
+
+
+async def test_tts_turn_closed_after_failure(monkeypatch: pytest.MonkeyPatch):
+    """The closing chunk is still sent when synthesis fails part way"""
+
+    async def stream(text: str, language: Language):
+        yield b"first"
+        raise RuntimeError("synthesis failed")
+
+    messages = await _send_tts(monkeypatch, stream)
+    assert [m.audio for m in messages] == [b"first", b""]
+    assert messages[-1].end_of_turn
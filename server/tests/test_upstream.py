@@ -0,0 +1,47 @@
+import asyncio
+
+from multivox import upstream
+from multivox.upstream import close_loop_locals, loop_local
+
+
+def test_loop_local_is_shared_per_loop():
+    """Each loop gets its own value, reused for the life of the loop"""
+
+    async def get_twice() -> tuple[object, object]:
+        return loop_local("value", object), loop_local("value", object)
+
+    first, again = asyncio.run(get_twice())
+    assert first is again
+
+    second, _ = asyncio.run(get_twice())
+    assert second is not first
+
+
+def test_closed_loops_are_forgotten():
+    """Values from closed loops are released once a new loop registers one"""
+    loops = []
+
+    async def register() -> None:
+        loops.append(asyncio.get_running_loop())
+        loop_local("value", object)
+
+    for _ in range(3):
+        asyncio.run(register())
+    assert loops[0] not in upstream._loop_locals
+    assert loops[1] not in upstream._loop_locals
+
+
+async def test_close_loop_locals_closes_values():
+    """Closing awaits each value's closer and forgets the loop's values"""
+    closed: list[str] = []
+
+    async def close(value: str) -> None:
+        closed.append(value)
+
+    loop_local("a", lambda: "a", close)
+    loop_local("b", lambda: "b")
+    await close_loop_locals()
+
+    assert closed == ["a"]
+    assert asyncio.get_running_loop() not in upstream._loop_locals
+    assert loop_local("a", lambda: "new a", close) == "new a"